@@ -4,21 +4,56 @@
 from __future__ import annotations
 
 import argparse
-import io
+import hashlib
 import json
+import pickle
+import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-
-# Fix Windows console encoding
-if sys.stdout.encoding != "utf-8":
-    sys.stdout = io.TextIOWrapper(
-        sys.stdout.buffer, encoding="utf-8", errors="replace"
-    )
+from typing import Any, Callable, Iterable, TypeVar
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib  # type: ignore[no-redef]
+
+from src.assemble import assemble
+from src.build_index import build_systematic_index
+from src.models import ParsedDocument, SubjectEntry
+from src.parse_docx import parse_docx
+from src.parse_informacoes import parse_informacoes
+from src.parse_referencias import parse_referencias
+from src.parse_xlsx import open_workbook, parse_law_mapping, parse_xlsx
+from src.render_html import render_cards
+from src.render_markdown import MarkdownRenderer
+from src.resolve_amendments import resolve_amendments
+from src.validate_xlsx import validate_xlsx
+from validate import get_paragraphs, run_checks
+
+# Fix Windows console encoding (reconfigure mantém o buffer atual do stream).
+# Em terminal, stdout é line-buffered para o progresso aparecer na hora; em
+# pipe/arquivo de log, os prints são agrupados em escritas maiores.
+for _stream, _line_buffering in ((sys.stdout, sys.stdout.isatty()), (sys.stderr, True)):
+    try:
+        _stream.reconfigure(encoding="utf-8", errors="replace", line_buffering=_line_buffering)
+    except AttributeError:  # stream substituído (ex.: IDE) sem reconfigure
+        pass
 
 BASE_DIR = Path(__file__).parent
+CACHE_DIR = BASE_DIR / "intermediate" / ".cache"
+
+T = TypeVar("T")
+
+# Sufixo de artigo letrado em qualquer posição: "212-A", "ADT4-C"
+_LETTERED_SUFFIX_RE = re.compile(r"-[A-Za-z]")
+
+# Vide "Assunto|Subassunto" → chave "assunto — subassunto" do índice
+_VIDE_SEP = str.maketrans({"|": " — "})
 
 
 # ── Validation report ────────────────────────────────────────────────────
@@ -62,9 +97,8 @@ class ValidationReport:
             "vide": "Vides apontando para assuntos inexistentes",
         }
 
-        print(f"\n{'─' * 60}")
-        print(f"  Relatório de validação")
-        print(f"{'─' * 60}")
+        # Relatório montado em memória e impresso numa única escrita
+        lines = [f"\n{'─' * 60}", "  Relatório de validação", "─" * 60]
 
         for cat, items in by_cat.items():
             label = cat_labels.get(cat, cat)
@@ -75,13 +109,13 @@ class ValidationReport:
                 parts.append(f"{errs} erro(s)")
             if warns:
                 parts.append(f"{warns} aviso(s)")
-            print(f"\n  [{label}] — {', '.join(parts)}")
+            lines.append(f"\n  [{label}] — {', '.join(parts)}")
             for item in items:
                 icon = "✗" if item.severity == "erro" else "·"
                 line = f"    {icon} {item.message}"
                 if item.context:
                     line += f"  ({item.context})"
-                print(line)
+                lines.append(line)
 
         n_err = len(self.errors)
         n_warn = len(self.warnings)
@@ -90,8 +124,9 @@ class ValidationReport:
             parts.append(f"{n_err} erro(s)")
         if n_warn:
             parts.append(f"{n_warn} aviso(s)")
-        print(f"\n  Total: {', '.join(parts)}")
-        print(f"{'─' * 60}")
+        lines.append(f"\n  Total: {', '.join(parts)}")
+        lines.append("─" * 60)
+        print("\n".join(lines))
 
     def to_json(self) -> list[dict]:
         return [
@@ -105,109 +140,319 @@ class ValidationReport:
         ]
 
 
+@lru_cache(maxsize=1)
 def _load_config() -> dict:
     """Lê config.local.toml (se existir) e retorna dict com paths."""
     config_path = BASE_DIR / "config.local.toml"
     if not config_path.exists():
         return {}
-    try:
-        import tomllib
-    except ModuleNotFoundError:
-        import tomli as tomllib  # type: ignore[no-redef]
     with open(config_path, "rb") as f:
         return tomllib.load(f)
 
 
-def _build_once(
-    *,
-    args: argparse.Namespace,
-    include_private: bool,
-    output_path: Path,
-    label: str,
-) -> ValidationReport:
-    """Executa o pipeline completo uma vez e salva em output_path."""
+# ── Cache de parse ───────────────────────────────────────────────────────
+
+def _cache_key(source: Path, args: tuple, kwargs: dict) -> str:
+    """Chave do cache: arquivo-fonte (mtime+tamanho), argumentos e código do parser.
+
+    Inclui o mtime dos módulos em src/ para que mudanças no parser
+    invalidem o cache automaticamente.
+    """
+    st = source.stat()
+    parts = [str(source.resolve()), str(st.st_mtime_ns), str(st.st_size)]
+    for mod in sorted((BASE_DIR / "src").glob("*.py")):
+        parts.append(f"{mod.name}:{mod.stat().st_mtime_ns}")
+    parts += [repr(a) for a in args if isinstance(a, (str, Path, bool, int))]
+    for k, v in sorted(kwargs.items()):
+        # sets não têm ordem estável entre execuções (hash randomization)
+        parts.append(f"{k}={sorted(v) if isinstance(v, (set, frozenset)) else v!r}")
+    return hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _cached(
+    name: str,
+    source: Path,
+    fn: Callable[..., T],
+    *args: Any,
+    use_cache: bool = True,
+    **kwargs: Any,
+) -> T:
+    """Executa fn(*args, **kwargs), reaproveitando o resultado salvo em disco.
+
+    O resultado é serializado com pickle em intermediate/.cache/{name}-{hash}.pkl;
+    entradas antigas do mesmo *name* são removidas ao gravar uma nova.
+
+    O sys.intern aplicado pelos parsers só vale no parse a frio: um resultado
+    lido do cache mantém o compartilhamento de strings dentro do próprio
+    objeto (o pickle preserva referências repetidas), mas essas strings não
+    são as da tabela de intern do processo.
+    """
+    if not use_cache:
+        return fn(*args, **kwargs)
+
+    key = _cache_key(source, args, kwargs)
+    cache_path = CACHE_DIR / f"{name}-{key}.pkl"
+    if cache_path.exists():
+        try:
+            with cache_path.open("rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # cache corrompido ou incompatível → reparseia
 
-    t0 = time.time()
-    report = ValidationReport()
-    print(f"\n{'═' * 60}")
-    print(f"  Build: {label}")
-    print(f"{'═' * 60}")
+    result = fn(*args, **kwargs)
 
-    # ── 1. Parse DOCX ──────────────────────────────────────────────────
-    print("[1/8] Parseando DOCX...")
-    from src.parse_docx import parse_docx
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in CACHE_DIR.glob(f"{name}-*.pkl"):
+        stale.unlink(missing_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with tmp_path.open("wb") as f:
+        pickle.dump(result, f, protocol=5)
+    tmp_path.replace(cache_path)
+    return result
+
+
+def _build_inputs(args: argparse.Namespace) -> list[Path]:
+    """Arquivos dos quais o HTML depende: fontes, código, template e config."""
+    inputs = [args.docx, args.xlsx, args.referencias, args.informacoes]
+    inputs += [Path(__file__), BASE_DIR / "validate.py", BASE_DIR / "config.local.toml"]
+    inputs += sorted((BASE_DIR / "src").glob("*.py"))
+    inputs += [
+        BASE_DIR / "templates" / "base.html",
+        BASE_DIR / "static" / "style.css",
+        BASE_DIR / "static" / "app.js",
+    ]
+    return inputs
 
+
+def _degraded_marker(output: Path) -> Path:
+    """Marcador gravado ao lado de *output* quando o build saiu incompleto."""
+    return output.with_name(output.name + ".degraded")
+
+
+def _inputs_stamp(output: Path) -> Path:
+    """Registro, ao lado de *output*, das entradas usadas no último build."""
+    return output.with_name(output.name + ".inputs")
+
+
+def _stamp_text(inputs: Iterable[Path]) -> str:
+    """Um caminho absoluto por linha, na ordem de _build_inputs."""
+    return "".join(f"{Path(p).resolve()}\n" for p in inputs)
+
+
+def _write_inputs_stamp(output: Path, inputs: Iterable[Path]) -> None:
+    _inputs_stamp(output).write_text(_stamp_text(inputs), encoding="utf-8")
+
+
+def _is_up_to_date(output: Path, inputs: Iterable[Path]) -> bool:
+    """True se *output* existe, foi gerado a partir destas mesmas entradas,
+    é mais novo que todas as que existem e não saiu degradado (ex.: sem o
+    índice remissivo, ou com o build interrompido)."""
+    inputs = list(inputs)
     try:
-        doc = parse_docx(args.docx, include_private=include_private)
-    except PermissionError:
-        print(f"\n⚠  Não foi possível abrir o DOCX: {args.docx}")
-        print("   O arquivo pode estar aberto no Word. Feche-o e tente novamente.")
-        input("\nPressione Enter para fechar...")
-        sys.exit(1)
-
-    headings = [e for e in doc.elements if hasattr(e, "level")]
-    articles = [e for e in doc.elements if hasattr(e, "art_number")]
-    print(f"      → {len(headings)} headings, {len(articles)} artigos")
-
-    # ── 1b. Validação do DOCX ─────────────────────────────────────────
-    from validate import get_paragraphs as _get_paras, run_checks as _run_checks, CODE_LABELS
-
-    _raw_paras = _get_paras(args.docx)
-    _docx_issues = _run_checks(_raw_paras)
-    if _docx_issues:
-        for iss in _docx_issues:
-            report.add("docx", "aviso", f"[{iss['code']}] {iss['desc']}", iss["context"])
-        print(f"      → {len(_docx_issues)} aviso(s) de formatação no DOCX")
-    else:
-        print(f"      → DOCX sem problemas de formatação")
+        out_mtime = output.stat().st_mtime_ns
+    except OSError:
+        return False
+    if _degraded_marker(output).exists():
+        return False
+    # Outro --docx/--xlsx (mesmo que mais antigo) exige rebuild
+    try:
+        if _inputs_stamp(output).read_text(encoding="utf-8") != _stamp_text(inputs):
+            return False
+    except OSError:
+        return False
+    for path in inputs:
+        try:
+            if path.stat().st_mtime_ns > out_mtime:
+                return False
+        except FileNotFoundError:
+            continue
+    return True
 
-    # ── 2. Resolve amendments ──────────────────────────────────────────
-    print("[2/8] Resolvendo emendas...")
-    from src.resolve_amendments import resolve_amendments
 
-    doc = resolve_amendments(doc)
+def _dump_json(path: Path, data: Any) -> None:
+    """Grava JSON indentado direto no arquivo, sem montar a string inteira."""
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
 
-    version_count = sum(
-        len(a.all_versions)  # type: ignore
-        + sum(1 for c in a.children if c.is_old_version)  # type: ignore
-        for a in articles
-    )
-    print(f"      → {version_count} versões anteriores detectadas")
 
-    # ── 3. Parse XLSX ──────────────────────────────────────────────────
-    print("[3/8] Parseando XLSX...")
-    from src.parse_xlsx import parse_xlsx, parse_law_mapping
+def _dump_ndjson(path: Path, records: Iterable[Any]) -> None:
+    """Grava um registro JSON compacto por linha, à medida que são gerados."""
+    with path.open("w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+
+
+def _entry_context(entry: SubjectEntry) -> str:
+    """Contexto do relatório: "assunto: Mesa > Composição"."""
+    if entry.sub_subject:
+        return f"assunto: {entry.subject} > {entry.sub_subject}"
+    return f"assunto: {entry.subject}"
+
 
-    xlsx_path = Path(args.xlsx)
+def _read_xlsx_normas(xlsx_path: Path, validate: bool = True):
+    """Abre o XLSX uma única vez, lê a aba Normas e (opcionalmente) valida o formato.
+
+    Não depende do DOCX. Retorna (workbook, law_mapping, erros de formato);
+    o workbook continua aberto para parse_xlsx e deve ser fechado pelo chamador.
+    """
+    wb = open_workbook(xlsx_path)
+    try:
+        law_mapping = parse_law_mapping(wb)
+        fmt_errs = validate_xlsx(wb, law_mapping) if validate else []
+    except BaseException:
+        wb.close()
+        raise
+    return wb, law_mapping, fmt_errs
+
+
+@dataclass
+class ParsedSources:
+    """Fontes parseadas uma única vez e compartilhadas por todas as saídas.
+
+    O DOCX é sempre lido com as notas privadas; a versão pública apenas
+    deixa de renderizá-las.
+    """
+    doc: ParsedDocument
+    law_mapping: dict[str, str]
+    subject_list: list[dict]
+    referencias_data: list[dict]
+    info_html: str
+    systematic_index: list[dict]
+    summaries_map: dict[str, str]
+    report: ValidationReport
+    degraded: bool = False  # XLSX existe mas não pôde ser aberto (sem índice remissivo)
+
+
+def _parse_sources(args: argparse.Namespace, *, html: bool = True) -> ParsedSources:
+    """Executa os estágios de parse e validação (uma vez por execução).
+
+    Com ``html=False`` (só Markdown), pula o que apenas o HTML usa: validação
+    do DOCX e da planilha, referências cruzadas, informações e índice
+    sistemático. O relatório fica vazio, como no build só de Markdown.
+    """
+
+    t0 = time.time()
+    report = ValidationReport()
+    use_cache = not args.no_cache
+    print(f"\n{'═' * 60}")
+    print("  Fontes")
+    print(f"{'═' * 60}")
+
+    # ── 1. Parse DOCX ──────────────────────────────────────────────────
+    print("[1/6] Parseando DOCX...")
+    xlsx_path: Path = args.xlsx
+    ref_path: Path = args.referencias
+    info_path: Path = args.informacoes
+
+    # DOCX (parse + leitura para validação), XLSX (aba Normas + validação),
+    # referências e informações são leituras independentes: feitas em
+    # paralelo, resultados coletados por estágio.
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        docx_future = pool.submit(
+            _cached, "docx", args.docx,
+            parse_docx, args.docx, include_private=True, use_cache=use_cache,
+        )
+        paras_future = pool.submit(get_paragraphs, args.docx) if html else None
+        xlsx_future = pool.submit(
+            _read_xlsx_normas, xlsx_path, html,
+        ) if xlsx_path.exists() else None
+        ref_future = pool.submit(
+            _cached, "referencias", ref_path, parse_referencias, ref_path, use_cache=use_cache,
+        ) if ref_path.exists() else None
+        info_future = pool.submit(
+            _cached, "informacoes", info_path, parse_informacoes, info_path, use_cache=use_cache,
+        ) if html and info_path.exists() else None
+
+    # Aba Normas: resolve_amendments já aplica os prefixos de lei.
+    # O workbook fica aberto até o parse do remissivo (estágio 3) e é fechado
+    # em qualquer saída, inclusive no sys.exit por DOCX bloqueado.
+    wb = None
     law_mapping: dict[str, str] = {}
-    subject_index = None
-    if xlsx_path.exists():
+    _fmt_errs: list[str] = []
+    if xlsx_future is not None:
         try:
-            law_mapping = parse_law_mapping(xlsx_path)
+            wb, law_mapping, _fmt_errs = xlsx_future.result()
+        except PermissionError:
+            pass  # avisado no estágio 3
+
+    try:
+        try:
+            doc = docx_future.result()
+        except PermissionError:
+            print(f"\n⚠  Não foi possível abrir o DOCX: {args.docx}")
+            print("   O arquivo pode estar aberto no Word. Feche-o e tente novamente.")
+            input("\nPressione Enter para fechar...")
+            sys.exit(1)
+
+        headings = doc.headings
+        articles = doc.articles
+        print(f"      → {len(headings)} headings, {len(articles)} artigos")
+
+        # ── 1b. Validação do DOCX (só para o HTML) ───────────────────────
+        if paras_future is not None:
+            _docx_issues = run_checks(paras_future.result())
+            if _docx_issues:
+                for iss in _docx_issues:
+                    report.add("docx", "aviso", f"[{iss['code']}] {iss['desc']}", iss["context"])
+                print(f"      → {len(_docx_issues)} aviso(s) de formatação no DOCX")
+            else:
+                print(f"      → DOCX sem problemas de formatação")
+
+        # ── 2. Resolve amendments ──────────────────────────────────────────
+        print("[2/6] Resolvendo emendas...")
+        doc = resolve_amendments(doc, law_mapping)
+
+        # Passada única pelos artigos: versões anteriores, artigos letrados,
+        # chaves para a checagem cruzada e mapa de sínteses
+        version_count = 0
+        known_lettered: set[str] = set()      # ex: "212-A"
+        known_adt_lettered: set[str] = set()  # ex: "4-C" (de "ADT4-C")
+        docx_arts: set[str] = set()           # chaves "LO:5" / "5" dos artigos do DOCX
+        summaries_map: dict[str, str] = {}    # {art_number: summary} para dicas de fallback
+        for a in articles:
+            version_count += len(a.all_versions)
+            for c in a.children:
+                if c.is_old_version:
+                    version_count += 1
+
+            art_number = a.art_number
+            if _LETTERED_SUFFIX_RE.search(art_number):
+                known_lettered.add(art_number)
+                if art_number.startswith("ADT"):
+                    known_adt_lettered.add(art_number[3:])
+
+            if a.law_prefix:
+                key = f"{a.law_prefix}:{art_number}"
+                # Lettered articles from other laws: also register plain art_number
+                # so range-expanded refs (e.g. 39-88 → 55-A) can match
+                docx_arts.add(art_number)
+            else:
+                key = art_number
+            docx_arts.add(key)
+            if a.summary:
+                summaries_map[key] = a.summary
+        print(f"      → {version_count} versões anteriores detectadas")
+
+        # ── 3. Parse XLSX ──────────────────────────────────────────────────
+        print("[3/6] Parseando XLSX...")
+        subject_index = None
+        if wb is not None:
             if law_mapping:
                 print(f"      → {len(law_mapping)} normas mapeadas")
 
-            from src.validate_xlsx import validate_xlsx as _validate_xlsx_fmt
-            _fmt_errs = _validate_xlsx_fmt(xlsx_path, law_mapping)
             for _e in _fmt_errs:
                 report.add("formato", "aviso", _e.strip())
 
-            # Artigos letrados do DOCX (ex: "212-A") para expansão correta de ranges
-            import re as _re
-            known_lettered: set[str] = {
-                el.art_number for el in doc.elements
-                if hasattr(el, "art_number") and _re.search(r"-[A-Za-z]", el.art_number)
-            }
-            subject_index = parse_xlsx(xlsx_path, known_lettered=known_lettered)
+            # known_lettered: artigos letrados do DOCX, para expansão correta de ranges
+            subject_index = _cached(
+                "remissivo", xlsx_path, parse_xlsx, wb,
+                known_lettered=known_lettered, use_cache=use_cache,
+            )
 
             # Normalizar refs de ADT letrados: "4-C" → "ADT4-C"
             # Apenas artigos com sufixo de letra (ex: 4-C, 4-F) pois números puros
             # (ex: 4, 15) podem ser artigos regulares do Regimento.
-            known_adt_lettered: set[str] = {
-                el.art_number[3:] for el in doc.elements
-                if hasattr(el, "art_number") and el.art_number.startswith("ADT")
-                and _re.search(r"-[A-Za-z]", el.art_number)
-            }
             if known_adt_lettered:
                 for entry in subject_index.entries:
                     for ref in entry.refs:
@@ -216,79 +461,52 @@ def _build_once(
 
             subject_list = subject_index.to_list()
             print(f"      → {len(subject_list)} assuntos")
-        except PermissionError:
+        elif xlsx_future is not None:
             print("      ⚠ Não foi possível abrir remissivo.xlsx (arquivo em uso pelo Excel?)")
             print("        Feche a planilha e rode o build novamente.")
             print("        Continuando sem índice remissivo...")
             subject_list = []
-    else:
-        print("      → XLSX não encontrado, índice remissivo vazio")
-        subject_list = []
-
-    # Cross-reference: articles in XLSX but not in DOCX
-    if subject_list:
-        docx_arts: set[str] = set()
-        for el in doc.elements:
-            if hasattr(el, "art_number"):
-                prefix = law_mapping.get(getattr(el, "law_name", None) or "", "")
-                docx_arts.add(f"{prefix}:{el.art_number}" if prefix else el.art_number)
-                # Lettered articles from other laws: also register plain art_number
-                # so range-expanded refs (e.g. 39-88 → 55-A) can match
-                if prefix:
-                    docx_arts.add(el.art_number)
-
-        seen_refs: set[str] = set()
-        for entry in subject_index.entries:
-            for ref in entry.refs:
-                key = f"{ref.law_prefix}:{ref.art}" if ref.law_prefix else ref.art
-                if key not in docx_arts and key not in seen_refs:
-                    seen_refs.add(key)
-                    art_label = f"Art. {ref.law_prefix}:{ref.art}" if ref.law_prefix else f"Art. {ref.art}"
-                    ctx = entry.subject
-                    if entry.sub_subject:
-                        ctx += f" > {entry.sub_subject}"
-                    report.add("ref_cruzada", "erro", art_label, f"assunto: {ctx}")
-
-    # Cross-reference: vides pointing to non-existent index entries
-    if subject_list:
+        else:
+            print("      → XLSX não encontrado, índice remissivo vazio")
+            subject_list = []
+    finally:
+        if wb is not None:
+            wb.close()
+
+    # Cross-references numa única passada pelas entries: artigos do XLSX
+    # ausentes no DOCX e vides apontando para assuntos inexistentes
+    if html and subject_list:
+        # Chaves "assunto" e "assunto — subassunto", normalizadas uma vez
         known_subjects: set[str] = set()
+        # Artigos do DOCX + refs já reportadas: um único teste de pertinência
+        checked = set(docx_arts)
+        # {chave do vide: (vide, entry)} da primeira ocorrência; só pode ser
+        # verificado depois que known_subjects estiver completo
+        pending_vides: dict[str, tuple[str, SubjectEntry]] = {}
         for entry in subject_index.entries:
-            known_subjects.add(entry.subject.lower())
+            subject = entry.subject.casefold()
+            known_subjects.add(subject)
             if entry.sub_subject:
-                known_subjects.add(f"{entry.subject} — {entry.sub_subject}".lower())
+                known_subjects.add(f"{subject} — {entry.sub_subject.casefold()}")
 
-        seen_vides: set[str] = set()
-        for entry in subject_index.entries:
+            ctx = ""
+            for ref in entry.refs:
+                key = f"{ref.law_prefix}:{ref.art}" if ref.law_prefix else ref.art
+                if key not in checked:
+                    checked.add(key)
+                    ctx = ctx or _entry_context(entry)
+                    report.add("ref_cruzada", "erro", f"Art. {key}", ctx)
             for v in entry.vides:
-                v_key = v.replace("|", " — ").lower()
-                if v_key not in known_subjects and v_key not in seen_vides:
-                    seen_vides.add(v_key)
-                    ctx = entry.subject
-                    if entry.sub_subject:
-                        ctx += f" > {entry.sub_subject}"
-                    report.add("vide", "aviso", f"\"{v}\"", f"assunto: {ctx}")
-
-    # Apply law prefixes to articles based on law_name ↔ mapping
-    if law_mapping:
-        from src.models import ArticleBlock as _AB
-        for el in doc.elements:
-            if isinstance(el, _AB) and el.law_name and el.law_name in law_mapping:
-                el.law_prefix = law_mapping[el.law_name]
-                lp = el.law_prefix
-                if el.caput:
-                    el.caput.uid = el.caput.uid.replace("art", f"art{lp}", 1)
-                for child in el.children:
-                    child.uid = child.uid.replace("art", f"art{lp}", 1)
-                for v in el.all_versions:
-                    v.uid = v.uid.replace("art", f"art{lp}", 1)
+                pending_vides.setdefault(v.translate(_VIDE_SEP).casefold(), (v, entry))
 
-    # ── 4. Parse referencias DOCX ────────────────────────────────────
-    print("[4/8] Parseando referências...")
-    from src.parse_referencias import parse_referencias
+        for v_key, (v, entry) in pending_vides.items():
+            if v_key not in known_subjects:
+                report.add("vide", "aviso", f"\"{v}\"", _entry_context(entry))
 
-    ref_path = Path(args.referencias)
-    if ref_path.exists():
-        referencias_data = parse_referencias(ref_path)
+    # ── 4. Parse referencias DOCX ────────────────────────────────────
+    print("[4/6] Parseando referências...")
+    if ref_future is not None:
+        referencias_data = ref_future.result()
         entry_count = sum(
             len(e["entries"]) for cat in referencias_data for e in cat["groups"]
         )
@@ -298,62 +516,31 @@ def _build_once(
         referencias_data = []
 
     # ── 5. Parse informacoes DOCX ─────────────────────────────────────
-    print("[5/8] Parseando informações...")
-    from src.parse_informacoes import parse_informacoes
-
-    info_path = Path(args.informacoes)
-    if info_path.exists():
-        info_html = parse_informacoes(info_path)
+    print("[5/6] Parseando informações...")
+    if not html:
+        print("      → pulado (só Markdown)")
+        info_html = ""
+    elif info_future is not None:
+        info_html = info_future.result()
         print(f"      → {len(info_html)} caracteres de HTML")
     else:
         print("      → DOCX de informações não encontrado, aba vazia")
         info_html = ""
 
     # ── 6. Build systematic index ──────────────────────────────────────
-    print("[6/8] Gerando índice sistemático...")
-    from src.build_index import build_systematic_index
-
-    systematic_index = build_systematic_index(doc)
-    print(f"      → {len(systematic_index)} nós raiz")
-
-    # ── 7. Render HTML cards ───────────────────────────────────────────
-    print("[7/8] Renderizando cards HTML...")
-    from src.render_html import render_cards
-
-    cards_html = render_cards(doc)
-    print(f"      → {len(cards_html)} caracteres de HTML")
-
-    # ── 8. Assemble ────────────────────────────────────────────────────
-    print("[8/8] Montando HTML final...")
-    from src.assemble import assemble
-
-    # Build summaries map: {art_number: summary} for fallback hints
-    summaries_map: dict[str, str] = {}
-    for el in doc.elements:
-        if hasattr(el, "art_number") and hasattr(el, "summary") and el.summary:
-            key = el.art_number
-            if hasattr(el, "law_prefix") and el.law_prefix:
-                key = el.law_prefix + ":" + key
-            summaries_map[key] = el.summary
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    assemble(
-        cards_html=cards_html,
-        systematic_index=systematic_index,
-        subject_index=subject_list,
-        referencias_index=referencias_data,
-        summaries_map=summaries_map,
-        info_html=info_html,
-        base_dir=BASE_DIR,
-        output_path=output_path,
-    )
+    print("[6/6] Gerando índice sistemático...")
+    if html:
+        systematic_index = build_systematic_index(doc)
+        print(f"      → {len(systematic_index)} nós raiz")
+    else:
+        print("      → pulado (só Markdown)")
+        systematic_index = []
 
-    elapsed = time.time() - t0
-    size_kb = output_path.stat().st_size / 1024
-    print(f"\n✓ {label} pronto em {elapsed:.1f}s → {output_path} ({size_kb:.0f} KB)")
+    print(f"\n✓ Fontes parseadas em {time.time() - t0:.1f}s")
 
     # ── Validation report ────────────────────────────────────────────
-    report.print_report()
+    if html:
+        report.print_report()
 
     # ── Debug output ───────────────────────────────────────────────────
     if args.debug:
@@ -361,49 +548,92 @@ def _build_once(
         debug_dir = BASE_DIR / "intermediate"
         debug_dir.mkdir(exist_ok=True)
 
-        doc_json = doc.to_dict()
-        (debug_dir / "parsed_document.json").write_text(
-            json.dumps(doc_json, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        print(f"  → {debug_dir / 'parsed_document.json'}")
+        # ndjson: um registro por linha; o documento é serializado elemento a
+        # elemento, sem materializar doc.to_dict()
+        if args.debug_format == "ndjson":
+            ext, dump = "ndjson", _dump_ndjson
+            doc_data: Any = doc.iter_dicts()
+        else:
+            ext, dump = "json", _dump_json
+            doc_data = doc.to_dict()
+
+        debug_files = {
+            f"parsed_document.{ext}": doc_data,
+            f"systematic_index.{ext}": systematic_index,
+            f"subject_index.{ext}": subject_list,
+            f"referencias_index.{ext}": referencias_data,
+        }
+        if report.issues:
+            debug_files[f"validation_report.{ext}"] = report.to_json()
 
-        (debug_dir / "systematic_index.json").write_text(
-            json.dumps(systematic_index, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        print(f"  → {debug_dir / 'systematic_index.json'}")
+        # Arquivos independentes: gravados em paralelo
+        with ThreadPoolExecutor(max_workers=len(debug_files)) as pool:
+            futures = {
+                name: pool.submit(dump, debug_dir / name, data)
+                for name, data in debug_files.items()
+            }
+        for name, future in futures.items():
+            future.result()  # propaga erros de escrita
+            print(f"  → {debug_dir / name}")
+
+    return ParsedSources(
+        doc=doc,
+        law_mapping=law_mapping,
+        subject_list=subject_list,
+        referencias_data=referencias_data,
+        info_html=info_html,
+        systematic_index=systematic_index,
+        summaries_map=summaries_map,
+        report=report,
+        degraded=xlsx_future is not None and wb is None,
+    )
 
-        (debug_dir / "subject_index.json").write_text(
-            json.dumps(subject_list, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        print(f"  → {debug_dir / 'subject_index.json'}")
 
-        (debug_dir / "referencias_index.json").write_text(
-            json.dumps(referencias_data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        print(f"  → {debug_dir / 'referencias_index.json'}")
+def _build_once(
+    *,
+    sources: ParsedSources,
+    include_private: bool,
+    output_path: Path,
+    label: str,
+) -> None:
+    """Renderiza uma variante do HTML a partir das fontes já parseadas."""
 
-        if report.issues:
-            (debug_dir / "validation_report.json").write_text(
-                json.dumps(report.to_json(), ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-            print(f"  → {debug_dir / 'validation_report.json'}")
+    t0 = time.time()
+    print(f"\n{'═' * 60}")
+    print(f"  Build: {label}")
+    print(f"{'═' * 60}")
+
+    # ── 1. Render HTML cards ───────────────────────────────────────────
+    # Gerados sob demanda: assemble escreve cada card direto no arquivo
+    print("[1/2] Renderizando cards HTML...")
+    cards_html = render_cards(sources.doc, include_private=include_private)
+
+    # ── 2. Assemble ────────────────────────────────────────────────────
+    print("[2/2] Montando HTML final...")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    size = assemble(
+        cards_html=cards_html,
+        systematic_index=sources.systematic_index,
+        subject_index=sources.subject_list,
+        referencias_index=sources.referencias_data,
+        summaries_map=sources.summaries_map,
+        info_html=sources.info_html,
+        base_dir=BASE_DIR,
+        output_path=output_path,
+    )
 
-    return report
+    elapsed = time.time() - t0
+    size_kb = size / 1024
+    print(f"\n✓ {label} pronto em {elapsed:.1f}s → {output_path} ({size_kb:.0f} KB)")
 
 
 def _build_markdown(
     *,
-    args: argparse.Namespace,
+    sources: ParsedSources,
     output_dir: Path,
-    include_private: bool,
     label: str,
 ) -> None:
-    """Gera 3 arquivos Markdown no diretório de saída."""
+    """Gera 3 arquivos Markdown no diretório de saída (com notas privadas)."""
 
     t0 = time.time()
     print(f"\n{'═' * 60}")
@@ -414,93 +644,20 @@ def _build_markdown(
         print(f"  ⚠ Diretório não encontrado: {output_dir}")
         return
 
-    # ── 1. Parse DOCX (sempre com notas privadas) ─────────────────
-    print("[1/5] Parseando DOCX...")
-    from src.parse_docx import parse_docx
-
-    doc = parse_docx(args.docx, include_private=include_private)
-    articles = [e for e in doc.elements if hasattr(e, "art_number")]
-    print(f"      → {len(articles)} artigos")
-
-    # ── 2. Resolve amendments ─────────────────────────────────────
-    print("[2/5] Resolvendo emendas...")
-    from src.resolve_amendments import resolve_amendments
-
-    doc = resolve_amendments(doc)
-
-    # ── 3. Parse XLSX ─────────────────────────────────────────────
-    print("[3/5] Parseando XLSX...")
-    from src.parse_xlsx import parse_xlsx, parse_law_mapping
-    import re as _re
-
-    xlsx_path = Path(args.xlsx)
-    law_mapping: dict[str, str] = {}
-    subject_list: list[dict] = []
-    if xlsx_path.exists():
-        try:
-            law_mapping = parse_law_mapping(xlsx_path)
-            known_lettered: set[str] = {
-                el.art_number for el in doc.elements
-                if hasattr(el, "art_number") and _re.search(r"-[A-Za-z]", el.art_number)
-            }
-            subject_index = parse_xlsx(xlsx_path, known_lettered=known_lettered)
-
-            # Normalizar refs de ADT letrados: "4-C" → "ADT4-C"
-            known_adt_lettered: set[str] = {
-                el.art_number[3:] for el in doc.elements
-                if hasattr(el, "art_number") and el.art_number.startswith("ADT")
-                and _re.search(r"-[A-Za-z]", el.art_number)
-            }
-            if known_adt_lettered:
-                for entry in subject_index.entries:
-                    for ref in entry.refs:
-                        if not ref.law_prefix and not ref.art.startswith("ADT") and ref.art in known_adt_lettered:
-                            ref.art = f"ADT{ref.art}"
-
-            subject_list = subject_index.to_list()
-            print(f"      → {len(subject_list)} assuntos")
-        except PermissionError:
-            print("      ⚠ Não foi possível abrir remissivo.xlsx")
-    else:
-        print("      → XLSX não encontrado")
-
-    # Apply law prefixes
-    if law_mapping:
-        from src.models import ArticleBlock as _AB
-
-        for el in doc.elements:
-            if isinstance(el, _AB) and el.law_name and el.law_name in law_mapping:
-                el.law_prefix = law_mapping[el.law_name]
-
-    # ── 4. Parse referências ──────────────────────────────────────
-    print("[4/5] Parseando referências...")
-    from src.parse_referencias import parse_referencias
-
-    ref_path = Path(args.referencias)
-    referencias_data: list[dict] = []
-    if ref_path.exists():
-        referencias_data = parse_referencias(ref_path)
-        print(f"      → {len(referencias_data)} categorias")
-    else:
-        print("      → DOCX de referências não encontrado")
-
-    # ── 5. Render Markdown ────────────────────────────────────────
-    print("[5/5] Renderizando Markdown...")
-    from src.render_markdown import MarkdownRenderer
-
+    print("[1/1] Renderizando Markdown...")
     renderer = MarkdownRenderer()
 
-    regimento_md = renderer.render_document(doc)
+    regimento_md = renderer.render_document(sources.doc)
     (output_dir / "regimento.md").write_text(regimento_md, encoding="utf-8")
     print(f"      → regimento.md ({len(regimento_md) / 1024:.0f} KB)")
 
-    if subject_list:
-        indice_md = renderer.render_subject_index(subject_list)
+    if sources.subject_list:
+        indice_md = renderer.render_subject_index(sources.subject_list)
         (output_dir / "indice-remissivo.md").write_text(indice_md, encoding="utf-8")
         print(f"      → indice-remissivo.md ({len(indice_md) / 1024:.0f} KB)")
 
-    if referencias_data:
-        refs_md = renderer.render_referencias(referencias_data)
+    if sources.referencias_data:
+        refs_md = renderer.render_referencias(sources.referencias_data)
         (output_dir / "referencias.md").write_text(refs_md, encoding="utf-8")
         print(f"      → referencias.md ({len(refs_md) / 1024:.0f} KB)")
 
@@ -514,22 +671,16 @@ def _auto_commit_and_push() -> None:
     if not public_html.exists():
         return
 
-    # Check if there are changes to commit
+    # Modificado, staged ou não rastreado: uma única chamada ao git
     result = subprocess.run(
-        ["git", "diff", "--quiet", "docs/index.html"],
+        ["git", "status", "--porcelain", "docs/index.html"],
         cwd=BASE_DIR,
         capture_output=True,
+        text=True,
     )
-    if result.returncode == 0:
-        # Also check if file is untracked
-        result2 = subprocess.run(
-            ["git", "ls-files", "--error-unmatch", "docs/index.html"],
-            cwd=BASE_DIR,
-            capture_output=True,
-        )
-        if result2.returncode == 0:
-            print("\n⊘ docs/index.html sem alterações — nada a commitar")
-            return
+    if result.returncode == 0 and not result.stdout.strip():
+        print("\n⊘ docs/index.html sem alterações — nada a commitar")
+        return
 
     print("\n── Git ──")
     subprocess.run(["git", "add", "docs/index.html"], cwd=BASE_DIR, check=True)
@@ -550,10 +701,10 @@ def main() -> int:
     output_cfg = config.get("output", {})
 
     # Defaults: config.local.toml → fallback local
-    default_docx = sources.get("docx", str(BASE_DIR / "regimentoInterno.docx"))
-    default_xlsx = sources.get("xlsx", str(BASE_DIR / "remissivo.xlsx"))
-    default_refs = sources.get("referencias", str(BASE_DIR / "referencias.docx"))
-    default_info = sources.get("informacoes", str(BASE_DIR / "informacoes.docx"))
+    default_docx = sources.get("docx", BASE_DIR / "regimentoInterno.docx")
+    default_xlsx = sources.get("xlsx", BASE_DIR / "remissivo.xlsx")
+    default_refs = sources.get("referencias", BASE_DIR / "referencias.docx")
+    default_info = sources.get("informacoes", BASE_DIR / "informacoes.docx")
     default_private = output_cfg.get("private", "")
     default_chatbot = output_cfg.get("chatbot", "")
 
@@ -565,23 +716,27 @@ def main() -> int:
         help="Salva JSONs intermediários em intermediate/",
     )
     parser.add_argument(
-        "--docx", default=default_docx,
+        "--debug-format", choices=("json", "ndjson"), default="json",
+        help="Formato dos arquivos de debug: json indentado (padrão) ou ndjson (um registro por linha)",
+    )
+    parser.add_argument(
+        "--docx", type=Path, default=default_docx,
         help="Caminho do DOCX",
     )
     parser.add_argument(
-        "--xlsx", default=default_xlsx,
+        "--xlsx", type=Path, default=default_xlsx,
         help="Caminho do XLSX",
     )
     parser.add_argument(
-        "--referencias", default=default_refs,
+        "--referencias", type=Path, default=default_refs,
         help="Caminho do DOCX de referências",
     )
     parser.add_argument(
-        "--informacoes", default=default_info,
+        "--informacoes", type=Path, default=default_info,
         help="Caminho do DOCX de informações",
     )
     parser.add_argument(
-        "--output", default=str(BASE_DIR / "docs" / "index.html"),
+        "--output", type=Path, default=BASE_DIR / "docs" / "index.html",
         help="Caminho de saída da versão pública (padrão: docs/index.html)",
     )
     parser.add_argument(
@@ -604,6 +759,14 @@ def main() -> int:
         "--only-markdown", action="store_true",
         help="Gera apenas os arquivos Markdown (pula HTML)",
     )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignora o cache de parse em intermediate/.cache e reparseia as fontes",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Regenera a versão privada mesmo que ela seja mais nova que as fontes",
+    )
     parser.add_argument(
         "--strict", action="store_true",
         help="Trata avisos como erros (exit code 1 se houver qualquer problema)",
@@ -624,31 +787,48 @@ def main() -> int:
         return 1
 
     t_total = time.time()
-    all_reports: list[ValidationReport] = []
+
+    # Parse único: as variantes só diferem na renderização das notas privadas.
+    # Sempre executado, mesmo que nada precise ser renderizado: a validação
+    # define o exit code.
+    sources = _parse_sources(args, html=build_public or build_private)
+
+    # Versão privada mais nova que todas as entradas (e completa): nada mudou
+    # desde o último build, não precisa renderizar de novo
+    private_path = Path(default_private)
+    private_inputs = _build_inputs(args)
+    if build_private and not args.force and _is_up_to_date(private_path, private_inputs):
+        print(f"\n⊘ Versão privada já atualizada: {default_private} (use --force para regenerar)")
+        build_private = False
 
     if build_public:
-        r = _build_once(
-            args=args,
+        _build_once(
+            sources=sources,
             include_private=False,
-            output_path=Path(args.output),
+            output_path=args.output,
             label="Versão pública (sem notas privadas)",
         )
-        all_reports.append(r)
 
     if build_private:
-        r = _build_once(
-            args=args,
+        # Marcado como degradado até terminar: se o render falhar ou o
+        # processo for interrompido, o próximo build não pula a versão privada
+        marker = _degraded_marker(private_path)
+        private_path.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        _build_once(
+            sources=sources,
             include_private=True,
-            output_path=Path(default_private),
+            output_path=private_path,
             label="Versão privada (com notas privadas)",
         )
-        all_reports.append(r)
+        _write_inputs_stamp(private_path, private_inputs)
+        if not sources.degraded:
+            marker.unlink(missing_ok=True)
 
     if build_markdown:
         _build_markdown(
-            args=args,
+            sources=sources,
             output_dir=Path(default_chatbot),
-            include_private=True,
             label="Markdown B para chatbot (com notas privadas)",
         )
 
@@ -662,9 +842,8 @@ def main() -> int:
         _auto_commit_and_push()
 
     # Exit code based on validation results
-    total_errors = sum(len(r.errors) for r in all_reports)
-    total_warnings = sum(len(r.warnings) for r in all_reports)
-    if total_errors or (args.strict and total_warnings):
+    report = sources.report
+    if report.errors or (args.strict and report.warnings):
         return 1
     return 0
 
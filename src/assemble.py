@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
+
+_TEMPLATE_SLOTS = ("CSS", "JS", "CARDS")
+_JS_SLOTS = ("SYSTEMATIC_INDEX", "SUBJECT_INDEX", "REFERENCIAS_INDEX", "SUMMARIES_MAP", "INFO_HTML")
+_TEMPLATE_SLOT_RE = re.compile(r"\{\{(" + "|".join(_TEMPLATE_SLOTS) + r")\}\}")
+_JS_SLOT_RE = re.compile(r"/\*__(" + "|".join(_JS_SLOTS) + r")__\*/(?:\[\]|\{\}|\"\")")
 
 
 def assemble(
-    cards_html: str,
+    cards_html: Iterable[str],
     systematic_index: list[dict],
     subject_index: list[dict],
     referencias_index: list[dict],
@@ -15,34 +23,79 @@ def assemble(
     info_html: str,
     base_dir: Path,
     output_path: Path,
-) -> None:
-    """Monta o dist/index.html final (self-contained)."""
-    template_path = base_dir / "templates" / "base.html"
-    css_path = base_dir / "static" / "style.css"
-    js_path = base_dir / "static" / "app.js"
+) -> int:
+    """Monta o dist/index.html final (self-contained).
 
-    template = template_path.read_text(encoding="utf-8")
-    css = css_path.read_text(encoding="utf-8")
-    js = js_path.read_text(encoding="utf-8")
+    Os cards são escritos à medida que são gerados, sem montar uma string
+    única, num arquivo temporário que só substitui *output_path* ao final.
+    Retorna o tamanho do arquivo gravado, em bytes.
+    """
+    template_parts, css, js_parts = _load_assets(base_dir)
 
-    # Inject data into JS placeholders
-    sys_json = json.dumps(systematic_index, ensure_ascii=False, indent=2)
-    subj_json = json.dumps(subject_index, ensure_ascii=False, indent=2)
-    ref_json = json.dumps(referencias_index, ensure_ascii=False, indent=2)
-    summaries_json = json.dumps(summaries_map, ensure_ascii=False)
+    # Dados injetados nos placeholders do JS (JSON compacto: consumido só pelo navegador)
+    payloads = {
+        "SYSTEMATIC_INDEX": systematic_index,
+        "SUBJECT_INDEX": subject_index,
+        "REFERENCIAS_INDEX": referencias_index,
+        "SUMMARIES_MAP": summaries_map,
+        "INFO_HTML": info_html,
+    }
 
-    js = js.replace("/*__SYSTEMATIC_INDEX__*/[]", sys_json)
-    js = js.replace("/*__SUBJECT_INDEX__*/[]", subj_json)
-    js = js.replace("/*__REFERENCIAS_INDEX__*/[]", ref_json)
-    js = js.replace("/*__SUMMARIES_MAP__*/{}", summaries_json)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Grava num temporário e só substitui a saída no fim: uma falha no meio
+    # da geração dos cards não deixa a página anterior truncada
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            # Partes alternam [texto, nome, texto, nome, ..., texto] (split com grupo)
+            for i, part in enumerate(template_parts):
+                if not i % 2:
+                    f.write(part)
+                elif part == "CARDS":
+                    for chunk in cards_html:
+                        f.write(chunk)
+                elif part == "CSS":
+                    f.write(css)
+                else:
+                    for j, js_part in enumerate(js_parts):
+                        if j % 2:
+                            js_part = json.dumps(payloads[js_part], ensure_ascii=False, separators=(",", ":"))
+                        f.write(js_part)
+            size = f.tell()  # posição final = bytes gravados (UTF-8, sem estado)
+        tmp_path.replace(output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return size
 
-    info_json = json.dumps(info_html, ensure_ascii=False)
-    js = js.replace("/*__INFO_HTML__*/\"\"", info_json)
 
-    # Assemble final HTML
-    final = template.replace("{{CSS}}", css)
-    final = final.replace("{{CARDS}}", cards_html)
-    final = final.replace("{{JS}}", js)
+@lru_cache(maxsize=4)
+def _load_assets(base_dir: Path) -> tuple[tuple[str, ...], str, tuple[str, ...]]:
+    """Lê template, CSS e JS uma única vez por base_dir, já divididos nos placeholders.
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(final, encoding="utf-8")
+    Num mesmo build, a versão privada reaproveita a leitura e a divisão já
+    feitas para a pública, em vez de ler e decodificar os arquivos de novo.
+    """
+    template_path = base_dir / "templates" / "base.html"
+    js_path = base_dir / "static" / "app.js"
+    template_parts = _split_slots(template_path, _TEMPLATE_SLOT_RE, _TEMPLATE_SLOTS)
+    css = (base_dir / "static" / "style.css").read_text(encoding="utf-8")
+    js_parts = _split_slots(js_path, _JS_SLOT_RE, _JS_SLOTS)
+    return template_parts, css, js_parts
+
+
+def _split_slots(path: Path, pattern: re.Pattern, slots: tuple[str, ...]) -> tuple[str, ...]:
+    """Divide o arquivo nos placeholders, exigindo cada um exatamente uma vez.
+
+    Um placeholder ausente ou repetido geraria HTML quebrado sem aviso.
+    """
+    parts = tuple(pattern.split(path.read_text(encoding="utf-8")))
+    found = parts[1::2]
+    problems = [
+        f"{slot} ({found.count(slot)}x)" for slot in slots if found.count(slot) != 1
+    ]
+    if problems:
+        raise ValueError(
+            f"{path}: cada placeholder deve aparecer exatamente uma vez: {', '.join(problems)}"
+        )
+    return parts
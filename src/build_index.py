@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from functools import lru_cache
 
 from .models import (
-    ArticleBlock, ParsedDocument, SectionHeading, UnitType,
+    ArticleBlock, ParsedDocument, UnitType,
     SysIndexNode, sys_index_to_list,
 )
 
+_SECAO_LEVELS = frozenset((UnitType.SECAO, UnitType.SUBSECAO))
+_TREE_LEVELS = _SECAO_LEVELS | {UnitType.TITULO, UnitType.CAPITULO}
+_ART_NUM_RE = re.compile(r"(\d+)(-([A-Z]))?$")  # "183-A" → ("183", "-A", "A")
+
 
 def build_systematic_index(doc: ParsedDocument) -> list[dict]:
     """Gera o índice sistemático como lista JSON-friendly.
@@ -17,14 +22,17 @@ def build_systematic_index(doc: ParsedDocument) -> list[dict]:
     Estrutura: TÍTULO > CAPÍTULO > SEÇÃO/SUBSEÇÃO (sem artigos).
     Normas não-Regimento aparecem só pelo nome, ao final.
     """
-    nodes = _build_tree(doc)
-    direct_articles = _collect_direct_articles(doc)
+    nodes, direct_articles = _build_tree(doc)
     _annotate_ranges(nodes, direct_articles)
     return sys_index_to_list(nodes)
 
 
-def _build_tree(doc: ParsedDocument) -> list[SysIndexNode]:
+def _build_tree(
+    doc: ParsedDocument,
+) -> tuple[list[SysIndexNode], dict[str, list[str]]]:
+    """Monta a árvore e, na mesma passada, mapeia section_id → artigos diretos."""
     root: list[SysIndexNode] = []
+    direct_articles: dict[str, list[str]] = defaultdict(list)
 
     current_titulo: SysIndexNode | None = None
     current_capitulo: SysIndexNode | None = None
@@ -36,9 +44,11 @@ def _build_tree(doc: ParsedDocument) -> list[SysIndexNode]:
 
     for el in doc.elements:
         if isinstance(el, ArticleBlock):
-            continue
-
-        if not isinstance(el, SectionHeading):
+            # Artigo pertence à seção mais interna aberta (ou à norma não-padrão)
+            for owner in (current_secao, current_capitulo, current_titulo, current_law_node):
+                if owner and owner.section_id:
+                    direct_articles[owner.section_id].append(el.art_number)
+                    break
             continue
 
         # Handle NORMA: headings (data_section starts with "norma")
@@ -59,6 +69,10 @@ def _build_tree(doc: ParsedDocument) -> list[SysIndexNode]:
                 current_secao = None
             continue
 
+        level = el.level
+        if level not in _TREE_LEVELS:
+            continue  # subtítulos não entram na árvore
+
         heading_text = el.text
         if el.subtitle:
             heading_text += " — " + el.subtitle
@@ -70,13 +84,13 @@ def _build_tree(doc: ParsedDocument) -> list[SysIndexNode]:
         # Determine the parent container (root list vs law node)
         container = current_law_node.children if not in_default_law and current_law_node else root
 
-        if el.level == UnitType.TITULO:
+        if level == UnitType.TITULO:
             current_titulo = node
             current_capitulo = None
             current_secao = None
             container.append(current_titulo)
 
-        elif el.level == UnitType.CAPITULO:
+        elif level == UnitType.CAPITULO:
             current_capitulo = node
             current_secao = None
             if current_titulo:
@@ -84,7 +98,7 @@ def _build_tree(doc: ParsedDocument) -> list[SysIndexNode]:
             else:
                 container.append(current_capitulo)
 
-        elif el.level in (UnitType.SECAO, UnitType.SUBSECAO):
+        elif level in _SECAO_LEVELS:
             current_secao = node
             if current_capitulo:
                 current_capitulo.children.append(current_secao)
@@ -93,58 +107,11 @@ def _build_tree(doc: ParsedDocument) -> list[SysIndexNode]:
             else:
                 container.append(current_secao)
 
-    return root
+    return root, dict(direct_articles)
 
 
 # ---- Article range annotation ----
 
-def _collect_direct_articles(doc: ParsedDocument) -> dict[str, list[str]]:
-    """Map each section_id to its direct article numbers."""
-    result: dict[str, list[str]] = defaultdict(list)
-
-    first_norma_seen = False
-    in_default_law = True
-    current_norma_id: str | None = None
-
-    current_titulo_id: str | None = None
-    current_capitulo_id: str | None = None
-    current_secao_id: str | None = None
-
-    for el in doc.elements:
-        if isinstance(el, SectionHeading):
-            if el.data_section.startswith("norma"):
-                if not first_norma_seen:
-                    first_norma_seen = True
-                    in_default_law = True
-                else:
-                    in_default_law = False
-                    current_norma_id = el.data_section
-                    current_titulo_id = None
-                    current_capitulo_id = None
-                    current_secao_id = None
-                continue
-
-            if el.level == UnitType.TITULO:
-                current_titulo_id = el.data_section
-                current_capitulo_id = None
-                current_secao_id = None
-            elif el.level == UnitType.CAPITULO:
-                current_capitulo_id = el.data_section
-                current_secao_id = None
-            elif el.level in (UnitType.SECAO, UnitType.SUBSECAO):
-                current_secao_id = el.data_section
-
-        elif isinstance(el, ArticleBlock):
-            section_id = (
-                current_secao_id or current_capitulo_id
-                or current_titulo_id or current_norma_id
-            )
-            if section_id:
-                result[section_id].append(el.art_number)
-
-    return dict(result)
-
-
 def _annotate_ranges(
     nodes: list[SysIndexNode], direct_articles: dict[str, list[str]],
 ) -> None:
@@ -159,21 +126,23 @@ def _annotate_ranges(
                 node.art_range = _format_art_range(arts)
 
 
+@lru_cache(maxsize=4096)
 def _art_sort_key(art_num: str) -> tuple:
     """Sort key: '1' < '4-A' < '183' < '183-A' < 'ADT1' < 'ADT4-A'."""
     is_adt = art_num.startswith("ADT")
     num_str = art_num[3:] if is_adt else art_num
-    m = re.match(r"(\d+)(?:-([A-Z]))?$", num_str)
+    m = _ART_NUM_RE.match(num_str)
     if m:
-        return (1 if is_adt else 0, int(m.group(1)), m.group(2) or "")
+        return (1 if is_adt else 0, int(m.group(1)), m.group(3) or "")
     return (1 if is_adt else 0, 0, num_str)
 
 
+@lru_cache(maxsize=4096)
 def _format_art_num(art_num: str) -> str:
     """Format: '1' → '1º', '10' → '10', '4-A' → '4º-A', '183-A' → '183-A'."""
     is_adt = art_num.startswith("ADT")
     num_str = art_num[3:] if is_adt else art_num
-    m = re.match(r"(\d+)(-[A-Z])?$", num_str)
+    m = _ART_NUM_RE.match(num_str)
     if not m:
         return num_str
     num = int(m.group(1))
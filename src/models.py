@@ -5,7 +5,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterator, Optional, TypeVar
 
 
 class UnitType(str, Enum):
@@ -64,8 +67,9 @@ class DocumentUnit:
     amendment_note: str = ""  # ex: "(Redação dada pela Resolução nº 21/2017)"
     children: list[DocumentUnit] = field(default_factory=list)
 
-    @property
+    @cached_property
     def full_text(self) -> str:
+        # Calculado no primeiro acesso; os runs não mudam depois do parse
         return "".join(r.text for r in self.runs)
 
 
@@ -92,23 +96,58 @@ class ArticleBlock:
     law_prefix: str = ""  # ex: "LO" (empty = Regimento, the default)
 
 
+_E = TypeVar("_E", SectionHeading, ArticleBlock)
+
+
 @dataclass
 class ParsedDocument:
     """Documento parseado completo."""
     elements: list[SectionHeading | ArticleBlock] = field(default_factory=list)
+    # Índice {tipo: elementos}, construído sob demanda por by_type()
+    _by_type: dict[type, list] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def by_type(self, cls: type[_E]) -> list[_E]:
+        """Elementos do tipo *cls*, na ordem do documento.
+
+        O índice é montado numa única passada sobre ``elements`` e reutilizado
+        nas chamadas seguintes; chame reindex() se ``elements`` for alterado.
+        """
+        if self._by_type is None:
+            self.reindex()
+        return self._by_type.get(cls, [])  # type: ignore[union-attr]
+
+    def reindex(self) -> None:
+        """Reconstrói o índice por tipo a partir de ``elements``."""
+        index: dict[type, list] = {}
+        for el in self.elements:
+            index.setdefault(type(el), []).append(el)
+        self._by_type = index
+
+    @property
+    def articles(self) -> list[ArticleBlock]:
+        return self.by_type(ArticleBlock)
+
+    @property
+    def headings(self) -> list[SectionHeading]:
+        return self.by_type(SectionHeading)
 
     def to_dict(self) -> dict:
         """Serializa para JSON-friendly dict."""
-        result = []
+        return {"elements": list(self.iter_dicts())}
+
+    def iter_dicts(self) -> Iterator[dict]:
+        """Serializa elemento a elemento, sem montar a lista inteira."""
         for el in self.elements:
             if isinstance(el, SectionHeading):
-                result.append({
+                yield {
                     "type": "heading",
                     "level": el.level.value,
                     "text": el.text,
                     "subtitle": el.subtitle,
                     "data_section": el.data_section,
-                })
+                }
             elif isinstance(el, ArticleBlock):
                 d = {
                     "type": "article",
@@ -125,22 +164,27 @@ class ParsedDocument:
                     d["law_name"] = el.law_name
                 if el.law_prefix:
                     d["law_prefix"] = el.law_prefix
-                result.append(d)
-        return {"elements": result}
+                yield d
 
 
 def _unit_to_dict(u: DocumentUnit) -> dict:
-    return {
+    # Campos com valor padrão são omitidos (mesmo critério de _run_to_dict)
+    d: dict = {
         "unit_type": u.unit_type.value,
         "identifier": u.identifier,
         "uid": u.uid,
         "text": u.full_text,
         "runs": [_run_to_dict(r) for r in u.runs],
-        "is_revoked": u.is_revoked,
-        "is_old_version": u.is_old_version,
-        "amendment_note": u.amendment_note,
-        "children": [_unit_to_dict(c) for c in u.children],
     }
+    if u.is_revoked:
+        d["is_revoked"] = True
+    if u.is_old_version:
+        d["is_old_version"] = True
+    if u.amendment_note:
+        d["amendment_note"] = u.amendment_note
+    if u.children:
+        d["children"] = [_unit_to_dict(c) for c in u.children]
+    return d
 
 
 def _run_to_dict(r: TextRun) -> dict:
@@ -187,46 +231,53 @@ class SubjectIndex:
     entries: list[SubjectEntry] = field(default_factory=list)
 
     def to_list(self) -> list[dict]:
-        """Agrupa entries pelo campo subject, com sub-assuntos aninhados."""
-        from collections import OrderedDict
-
-        groups: OrderedDict[str, dict] = OrderedDict()
-        for e in self.entries:
-            key = e.subject
-            if key not in groups:
-                groups[key] = {"subject": key, "refs": [], "children": [], "vides": []}
-
-            refs_dicts = []
-            for r in e.refs:
-                rd: dict = {"art": r.art, "detail": r.detail}
-                if r.law_prefix:
-                    rd["law_prefix"] = r.law_prefix
-                if r.hint:
-                    rd["hint"] = r.hint
-                refs_dicts.append(rd)
-            if e.sub_subject:
-                child: dict = {
-                    "sub_subject": e.sub_subject,
-                    "refs": refs_dicts,
-                }
-                if e.vides:
-                    child["vides"] = e.vides
-                groups[key]["children"].append(child)
-            else:
-                groups[key]["refs"].extend(refs_dicts)
-                if e.vides:
-                    groups[key]["vides"].extend(e.vides)
-
-        result = list(groups.values())
-        # Remove empty children/refs/vides lists for cleaner JSON
-        for item in result:
-            if not item["children"]:
-                del item["children"]
-            if not item["refs"]:
-                del item["refs"]
-            if not item["vides"]:
-                del item["vides"]
-        return sorted(result, key=lambda x: x["subject"].lower())
+        """Agrupa entries pelo campo subject, com sub-assuntos aninhados.
+
+        As entries são ordenadas (sem distinção de caixa) e agrupadas numa
+        única passada; listas vazias não chegam a ser emitidas. Assuntos que
+        diferem só na caixa ficam na ordem da primeira aparição na planilha.
+        """
+        first_seen: dict[str, int] = {}
+        for i, e in enumerate(self.entries):
+            first_seen.setdefault(e.subject, i)
+        ordered = sorted(self.entries, key=lambda e: (e.subject.casefold(), first_seen[e.subject]))
+        result: list[dict] = []
+        for subject, group in groupby(ordered, key=attrgetter("subject")):
+            refs: list[dict] = []
+            children: list[dict] = []
+            vides: list[str] = []
+            for e in group:
+                refs_dicts = [_ref_to_dict(r) for r in e.refs]
+                if e.sub_subject:
+                    child: dict = {
+                        "sub_subject": e.sub_subject,
+                        "refs": refs_dicts,
+                    }
+                    if e.vides:
+                        child["vides"] = e.vides
+                    children.append(child)
+                else:
+                    refs.extend(refs_dicts)
+                    vides.extend(e.vides)
+
+            item: dict = {"subject": subject}
+            if refs:
+                item["refs"] = refs
+            if children:
+                item["children"] = children
+            if vides:
+                item["vides"] = vides
+            result.append(item)
+        return result
+
+
+def _ref_to_dict(r: SubjectRef) -> dict:
+    d: dict = {"art": r.art, "detail": r.detail}
+    if r.law_prefix:
+        d["law_prefix"] = r.law_prefix
+    if r.hint:
+        d["hint"] = r.hint
+    return d
 
 
 @dataclass
@@ -246,15 +297,26 @@ class SysIndexLeaf:
 
 
 def sys_index_to_list(nodes: list[SysIndexNode | SysIndexLeaf]) -> list[dict]:
-    result = []
-    for n in nodes:
-        if isinstance(n, SysIndexLeaf):
-            result.append({"label": n.label, "art": n.art})
-        else:
-            d: dict = {"title": n.title, "children": sys_index_to_list(n.children)}
+    """Serializa a árvore com pilha explícita (sem recursão).
+
+    Cada nó ganha sua lista "children" vazia na hora em que é emitido; a pilha
+    guarda pares (nós de origem, lista de destino) a preencher depois.
+    """
+    result: list[dict] = []
+    stack: list[tuple[list[SysIndexNode | SysIndexLeaf], list[dict]]] = [(nodes, result)]
+    while stack:
+        src, out = stack.pop()
+        for n in src:
+            if isinstance(n, SysIndexLeaf):
+                out.append({"label": n.label, "art": n.art})
+                continue
+            children: list[dict] = []
+            d: dict = {"title": n.title, "children": children}
             if n.section_id:
                 d["section_id"] = n.section_id
             if n.art_range:
                 d["art_range"] = n.art_range
-            result.append(d)
+            out.append(d)
+            if n.children:
+                stack.append((n.children, children))
     return result
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -20,6 +21,36 @@ NS = {
 }
 
 REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# Nomes qualificados pré-montados (notação {ns}tag): os loops por parágrafo
+# e por run usam estas constantes em vez de formatar f"{{{w}}}tag" a cada vez.
+_W = "{" + NS["w"] + "}"
+_R = "{" + NS["r"] + "}"
+W_BODY = _W + "body"
+W_P = _W + "p"
+W_PPR = _W + "pPr"
+W_JC = _W + "jc"
+W_IND = _W + "ind"
+W_VAL = _W + "val"
+W_LEFT = _W + "left"
+W_ID = _W + "id"
+W_TYPE = _W + "type"
+W_NAME = _W + "name"
+W_ANCHOR = _W + "anchor"
+W_BOOKMARK_START = _W + "bookmarkStart"
+W_R = _W + "r"
+W_RPR = _W + "rPr"
+W_B = _W + "b"
+W_I = _W + "i"
+W_STRIKE = _W + "strike"
+W_T = _W + "t"
+W_TAB = _W + "tab"
+W_BR = _W + "br"
+W_HYPERLINK = _W + "hyperlink"
+W_FOOTNOTE = _W + "footnote"
+W_FOOTNOTE_REF = _W + "footnoteRef"
+W_FOOTNOTE_REFERENCE = _W + "footnoteReference"
+R_ID = _R + "id"
 HYPERLINK_TYPE = (
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
 )
@@ -38,9 +69,11 @@ RE_ARTIGO = re.compile(
 RE_PARAGRAFO_UNICO = re.compile(r"^Par[aá]grafo\s+[uú]nico", re.IGNORECASE)
 RE_PARAGRAFO_NUM = re.compile(r"^[§Ss]\s*(\d+)(\.?[ºª°]?)")
 RE_INCISO = re.compile(r"^l?[IVXLC]+\s*[-–—]")
+RE_INCISO_NUM = re.compile(r"^(l?[IVXLC]+)")
 RE_ALINEA = re.compile(r"^[a-z]\)")
-RE_SUB_ALINEA = re.compile(r"^\d+\)")
+RE_SUB_ALINEA = re.compile(r"^(\d+)\)")
 RE_ITEM_NUM = re.compile(r"^\d+\s*[-–—]")
+RE_LEADING_NUM = re.compile(r"^(\d+)")
 RE_SUBTITLE_PREFIX = re.compile(
     r"^(D[AOES]S?\s|ATO\s|DISPOSIÇÕES|DISPOSICOES)", re.IGNORECASE
 )
@@ -58,6 +91,7 @@ RE_AMENDMENT = re.compile(
     re.IGNORECASE,
 )
 RE_NORMA = re.compile(r"^NORMA:\s*(.+)", re.IGNORECASE)
+RE_REVOGADO = re.compile(r"\(Revogad[oa]", re.IGNORECASE)
 
 
 def parse_docx(path: str | Path, *, include_private: bool = False) -> ParsedDocument:
@@ -115,7 +149,6 @@ def _parse_footnotes_xml(
     summaries (the text after "s " is the summary string).
     *private_fn_ids* contains the Word footnote IDs that had the "b " prefix.
     """
-    w = NS["w"]
     footnotes: dict[int, list[FootnotePara]] = {}
     summaries: dict[int, str] = {}
     private_fn_ids: set[int] = set()
@@ -125,9 +158,9 @@ def _parse_footnotes_xml(
         return footnotes, summaries, private_fn_ids
 
     root = ET.fromstring(data)
-    for fn_el in root.findall(f"{{{w}}}footnote"):
-        fn_id_str = fn_el.get(f"{{{w}}}id", "")
-        fn_type = fn_el.get(f"{{{w}}}type", "")
+    for fn_el in root.findall(W_FOOTNOTE):
+        fn_id_str = fn_el.get(W_ID, "")
+        fn_type = fn_el.get(W_TYPE, "")
         # Skip built-in separator/continuationSeparator footnotes
         if fn_type in ("separator", "continuationSeparator"):
             continue
@@ -137,21 +170,21 @@ def _parse_footnotes_xml(
             continue
 
         paras: list[FootnotePara] = []
-        for p_el in fn_el.findall(f"{{{w}}}p"):
+        for p_el in fn_el.findall(W_P):
             runs: list[TextRun] = []
-            for r_el in p_el.findall(f"{{{w}}}r"):
+            for r_el in p_el.findall(W_R):
                 # Skip footnoteRef marker run (just the superscript number)
-                if r_el.find(f"{{{w}}}footnoteRef") is not None:
+                if r_el.find(W_FOOTNOTE_REF) is not None:
                     continue
-                tr = _parse_run(r_el, w)
+                tr = _parse_run(r_el)
                 if tr.text:
                     runs.append(tr)
             # Detect paragraph indent via <w:ind w:left="...">
             indent = False
-            ppr = p_el.find(f"{{{w}}}pPr")
+            ppr = p_el.find(W_PPR)
             if ppr is not None:
-                ind_el = ppr.find(f"{{{w}}}ind")
-                if ind_el is not None and ind_el.get(f"{{{w}}}left", "0") != "0":
+                ind_el = ppr.find(W_IND)
+                if ind_el is not None and ind_el.get(W_LEFT, "0") != "0":
                     indent = True
             paras.append(FootnotePara(runs=runs, indent=indent))
 
@@ -210,12 +243,12 @@ def _parse_document_xml(
     """Parseia word/document.xml e retorna lista de parágrafos raw."""
     data = zf.read("word/document.xml")
     root = ET.fromstring(data)
-    body = root.find(f"{{{NS['w']}}}body")
+    body = root.find(W_BODY)
     if body is None:
         return []
 
     paragraphs: list[_RawParagraph] = []
-    for p_el in body.findall(f"{{{NS['w']}}}p"):
+    for p_el in body.findall(W_P):
         para = _parse_paragraph(p_el, rels)
         paragraphs.append(para)
     return paragraphs
@@ -224,20 +257,17 @@ def _parse_document_xml(
 def _parse_paragraph(
     p_el: ET.Element, rels: dict[str, tuple[str, str]]
 ) -> _RawParagraph:
-    w = NS["w"]
-    r_ns = NS["r"]
-
     # Paragraph properties
-    ppr = p_el.find(f"{{{w}}}pPr")
+    ppr = p_el.find(W_PPR)
     is_centered = False
     indent_left = 0
     if ppr is not None:
-        jc = ppr.find(f"{{{w}}}jc")
-        if jc is not None and jc.get(f"{{{w}}}val", "") == "center":
+        jc = ppr.find(W_JC)
+        if jc is not None and jc.get(W_VAL, "") == "center":
             is_centered = True
-        ind = ppr.find(f"{{{w}}}ind")
+        ind = ppr.find(W_IND)
         if ind is not None:
-            left_val = ind.get(f"{{{w}}}left", "0")
+            left_val = ind.get(W_LEFT, "0")
             try:
                 indent_left = int(left_val)
             except ValueError:
@@ -245,9 +275,9 @@ def _parse_paragraph(
 
     # Bookmark name (first bookmark in paragraph)
     bookmark_name = ""
-    bm = p_el.find(f"{{{w}}}bookmarkStart")
+    bm = p_el.find(W_BOOKMARK_START)
     if bm is not None:
-        bookmark_name = bm.get(f"{{{w}}}name", "")
+        bookmark_name = bm.get(W_NAME, "")
 
     # Collect runs (both direct w:r and inside w:hyperlink)
     runs: list[TextRun] = []
@@ -256,30 +286,30 @@ def _parse_paragraph(
 
     for child in p_el:
         tag = child.tag
-        if tag == f"{{{w}}}r":
+        if tag == W_R:
             # Check for footnoteReference inside this run
-            fn_ref = child.find(f"{{{w}}}footnoteReference")
+            fn_ref = child.find(W_FOOTNOTE_REFERENCE)
             if fn_ref is not None:
-                fn_id_str = fn_ref.get(f"{{{w}}}id", "")
+                fn_id_str = fn_ref.get(W_ID, "")
                 try:
                     footnote_ids.append(int(fn_id_str))
                 except ValueError:
                     pass
                 # Don't skip — there might also be text in this run
-            tr = _parse_run(child, w)
+            tr = _parse_run(child)
             if tr.text:
                 runs.append(tr)
                 if tr.strike:
                     has_strike = True
-        elif tag == f"{{{w}}}hyperlink":
+        elif tag == W_HYPERLINK:
             # Get hyperlink target
-            rid = child.get(f"{{{r_ns}}}id", "")
-            anchor = child.get(f"{{{w}}}anchor", "")
+            rid = child.get(R_ID, "")
+            anchor = child.get(W_ANCHOR, "")
             url = ""
             if rid and rid in rels:
                 url = rels[rid][0]
-            for r_el in child.findall(f"{{{w}}}r"):
-                tr = _parse_run(r_el, w)
+            for r_el in child.findall(W_R):
+                tr = _parse_run(r_el)
                 if tr.text:
                     tr.hyperlink_url = url or None
                     tr.hyperlink_anchor = anchor or None
@@ -292,9 +322,16 @@ def _parse_paragraph(
     # Check if paragraph is predominantly strikethrough.
     # Word often leaves the identifier prefix un-struck, so we use a
     # character-count majority: >50% of non-whitespace chars are struck.
-    strike_chars = sum(len(r.text.strip()) for r in runs if r.strike)
-    total_chars = sum(len(r.text.strip()) for r in runs)
-    all_strike = total_chars > 0 and strike_chars > total_chars * 0.5
+    # Only counted when some run is struck; both totals come from one pass.
+    all_strike = False
+    if has_strike:
+        strike_chars = total_chars = 0
+        for r in runs:
+            n = len(r.text.strip())
+            total_chars += n
+            if r.strike:
+                strike_chars += n
+        all_strike = total_chars > 0 and strike_chars > total_chars * 0.5
 
     return _RawParagraph(
         text=full_text,
@@ -307,27 +344,27 @@ def _parse_paragraph(
     )
 
 
-def _parse_run(r_el: ET.Element, w: str) -> TextRun:
+def _parse_run(r_el: ET.Element) -> TextRun:
     """Parseia um <w:r> e retorna TextRun."""
-    rpr = r_el.find(f"{{{w}}}rPr")
+    rpr = r_el.find(W_RPR)
     bold = False
     italic = False
     strike = False
     if rpr is not None:
-        if rpr.find(f"{{{w}}}b") is not None:
+        if rpr.find(W_B) is not None:
             bold = True
-        if rpr.find(f"{{{w}}}i") is not None:
+        if rpr.find(W_I) is not None:
             italic = True
-        if rpr.find(f"{{{w}}}strike") is not None:
+        if rpr.find(W_STRIKE) is not None:
             strike = True
 
     text_parts = []
-    for t_el in r_el.findall(f"{{{w}}}t"):
+    for t_el in r_el.findall(W_T):
         text_parts.append(t_el.text or "")
     # Also handle w:tab, w:br
-    for tab_el in r_el.findall(f"{{{w}}}tab"):
+    for tab_el in r_el.findall(W_TAB):
         text_parts.append("\t")
-    for br_el in r_el.findall(f"{{{w}}}br"):
+    for br_el in r_el.findall(W_BR):
         text_parts.append("\n")
 
     text = "".join(text_parts)
@@ -354,11 +391,7 @@ class _ClassifiedParagraph:
 def _classify_paragraphs(
     paragraphs: list[_RawParagraph],
 ) -> list[_ClassifiedParagraph]:
-    result: list[_ClassifiedParagraph] = []
-    for p in paragraphs:
-        cp = _classify_one(p)
-        result.append(cp)
-    return result
+    return [_classify_one(p) for p in paragraphs]
 
 
 def _classify_one(p: _RawParagraph) -> _ClassifiedParagraph:
@@ -417,7 +450,7 @@ def _classify_one(p: _RawParagraph) -> _ClassifiedParagraph:
         elif RE_INCISO.match(text):
             ut = UnitType.INCISO
             # Extract roman numeral
-            m3 = re.match(r"^(l?[IVXLC]+)", text)
+            m3 = RE_INCISO_NUM.match(text)
             raw = m3.group(1) if m3 else ""
             # Fix common typo: lowercase L at start = I
             if raw.startswith("l"):
@@ -428,16 +461,16 @@ def _classify_one(p: _RawParagraph) -> _ClassifiedParagraph:
             ident = text[0] + ")"
         elif RE_SUB_ALINEA.match(text) and p.indent_left >= 600:
             ut = UnitType.SUB_ALINEA
-            m4 = re.match(r"^(\d+)\)", text)
+            m4 = RE_SUB_ALINEA.match(text)
             ident = m4.group(0) if m4 else text[:3]
         elif RE_ITEM_NUM.match(text):
             ut = UnitType.ITEM_NUM
-            m5 = re.match(r"^(\d+)", text)
+            m5 = RE_LEADING_NUM.match(text)
             ident = m5.group(1) if m5 else ""
         elif RE_SUB_ALINEA.match(text):
             # Numbered items like "1)" without extra indent → treat as ITEM_NUM
             ut = UnitType.ITEM_NUM
-            m4 = re.match(r"^(\d+)\)", text)
+            m4 = RE_SUB_ALINEA.match(text)
             ident = m4.group(0) if m4 else text[:3]
         else:
             ut = UnitType.OTHER
@@ -694,7 +727,7 @@ def _build_document(
                         break
 
                 current_article = ArticleBlock(
-                    art_number=effective_num,
+                    art_number=sys.intern(effective_num),
                     is_adt=in_adt,
                     summary=summary,
                     law_name=current_law_name,
@@ -797,7 +830,7 @@ def _uid_suffix(cp: _ClassifiedParagraph) -> str:
         num = m.group(1) if m else "0"
         return f"p{num}"
     elif cp.unit_type == UnitType.INCISO:
-        m = re.match(r"^(l?[IVXLC]+)", cp.text)
+        m = RE_INCISO_NUM.match(cp.text)
         raw = m.group(1) if m else ""
         if raw.startswith("l"):
             raw = "I" + raw[1:]
@@ -805,11 +838,11 @@ def _uid_suffix(cp: _ClassifiedParagraph) -> str:
     elif cp.unit_type == UnitType.ALINEA:
         return cp.text[0]
     elif cp.unit_type == UnitType.SUB_ALINEA:
-        m = re.match(r"^(\d+)\)", cp.text)
+        m = RE_SUB_ALINEA.match(cp.text)
         num = m.group(1) if m else "0"
         return f"sub{num}"
     elif cp.unit_type == UnitType.ITEM_NUM:
-        m = re.match(r"^(\d+)", cp.text)
+        m = RE_LEADING_NUM.match(cp.text)
         num = m.group(1) if m else "0"
         return f"item{num}"
     return ""
@@ -850,6 +883,9 @@ def _make_hierarchical_uid(
 def _extract_amendment_note(runs: list[TextRun]) -> str:
     """Extrai nota de emenda do texto dos runs."""
     full = "".join(r.text for r in runs)
+    # Toda nota começa com "(": sem parêntese, dispensa a busca no parágrafo inteiro
+    if "(" not in full:
+        return ""
     m = RE_AMENDMENT.search(full)
     if m:
         # Extract from the opening paren to the closing paren
@@ -867,4 +903,4 @@ def _extract_amendment_note(runs: list[TextRun]) -> str:
 
 
 def _is_revoked_text(text: str) -> bool:
-    return bool(re.search(r"\(Revogad[oa]", text, re.IGNORECASE))
+    return "(" in text and bool(RE_REVOGADO.search(text))
@@ -3,58 +3,97 @@
 from __future__ import annotations
 
 import re
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from .models import SubjectEntry, SubjectIndex, SubjectRef
 
+if TYPE_CHECKING:
+    from openpyxl.workbook.workbook import Workbook
 
-def parse_law_mapping(path: str | Path) -> dict[str, str]:
+_LAW_PREFIX_RE = re.compile(r"^([A-Z]{2,})\s*:\s*(.+)$")
+_HINT_RE = re.compile(r"\(([^)]+)\)\s*$")
+_RANGE_RE = re.compile(r"^(\d+)\s*[-–—]\s*(\d+)$")
+_LETTERED_RE = re.compile(r"^(\d+)-[A-Za-z]")
+_ART_RE = re.compile(r"^(?:ADT)?\d+[-A-Za-z]*$")
+_PARAGRAFO_RE = re.compile(r"^(?:[§Ss]\s*|[pP])(\d+)$")  # "§10", "S 1", "p1"
+
+
+def open_workbook(path: str | Path) -> Workbook:
+    """Abre o XLSX em modo streaming (read_only + data_only, sem links externos).
+
+    O chamador é responsável por ``wb.close()``. Permite que parse_law_mapping,
+    parse_xlsx e validate_xlsx compartilhem uma única leitura do arquivo.
+    """
+    import openpyxl
+
+    return openpyxl.load_workbook(Path(path), read_only=True, data_only=True, keep_links=False)
+
+
+@contextmanager
+def as_workbook(source: str | Path | Workbook) -> Iterator[Workbook]:
+    """Usa o workbook recebido ou abre (e fecha) um a partir do caminho."""
+    if not isinstance(source, (str, Path)):
+        yield source
+        return
+    wb = open_workbook(source)
+    try:
+        yield wb
+    finally:
+        wb.close()
+
+
+def parse_law_mapping(source: str | Path | Workbook) -> dict[str, str]:
     """Lê aba 'Normas' do XLSX → {nome: prefixo}.
 
     A aba deve ter colunas: Prefixo | Nome.
     Retorna dict vazio se a aba não existir.
+    ``source`` pode ser um caminho ou um workbook já aberto por open_workbook.
     """
-    import openpyxl
-
-    path = Path(path)
-    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
     mapping: dict[str, str] = {}
-    if "Normas" in wb.sheetnames:
-        ws = wb["Normas"]
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if not row or len(row) < 2:
-                continue
-            prefix = str(row[0] or "").strip()
-            name = str(row[1] or "").strip()
-            if prefix and name:
-                mapping[name] = prefix
-    wb.close()
+    with as_workbook(source) as wb:
+        if "Normas" in wb.sheetnames:
+            ws = wb["Normas"]
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if not row or len(row) < 2:
+                    continue
+                prefix = str(row[0] or "").strip()
+                name = str(row[1] or "").strip()
+                if prefix and name:
+                    mapping[name] = prefix
     return mapping
 
 
-def parse_xlsx(path: str | Path, known_lettered: set[str] | None = None) -> SubjectIndex:
+def parse_xlsx(
+    source: str | Path | Workbook, known_lettered: set[str] | None = None,
+) -> SubjectIndex:
     """Parseia remissivo.xlsx e retorna SubjectIndex.
 
+    ``source`` pode ser um caminho ou um workbook já aberto por open_workbook.
     known_lettered: conjunto de art_numbers letrados conhecidos (ex: {"212-A", "183-A"})
     para incluir em expansões de range.
     """
-    import openpyxl
+    with as_workbook(source) as wb:
+        ws = main_sheet(wb)
+        if ws is None:
+            return SubjectIndex(entries=[])
+        return _parse_rows(ws.iter_rows(min_row=2, values_only=True), known_lettered)
 
-    path = Path(path)
-    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-    # Use first sheet that isn't "Normas" (avoid depending on active sheet)
-    ws = None
+
+def main_sheet(wb: Workbook):
+    """Primeira aba que não é "Normas" (não depende da aba ativa)."""
     for name in wb.sheetnames:
         if name != "Normas":
-            ws = wb[name]
-            break
-    if ws is None:
-        wb.close()
-        return SubjectIndex(entries=[])
+            return wb[name]
+    return None
 
-    rows = list(ws.iter_rows(min_row=2, values_only=True))
-    wb.close()
 
+def _parse_rows(rows: Iterable[tuple], known_lettered: set[str] | None) -> SubjectIndex:
+    """Converte as linhas da aba principal (sem cabeçalho) em SubjectIndex."""
+    lettered_by_base = _group_lettered(known_lettered)
     entries: list[SubjectEntry] = []
     for row in rows:
         if not row or len(row) < 3:
@@ -68,7 +107,7 @@ def parse_xlsx(path: str | Path, known_lettered: set[str] | None = None) -> Subj
         if not assunto:
             continue
 
-        refs = _parse_dispositivos(dispositivos_raw, known_lettered)
+        refs = _parse_dispositivos(dispositivos_raw, lettered_by_base)
         vides = [v.strip() for v in vides_raw.split("\n") if v.strip()] if vides_raw else []
 
         entries.append(SubjectEntry(
@@ -81,7 +120,19 @@ def parse_xlsx(path: str | Path, known_lettered: set[str] | None = None) -> Subj
     return SubjectIndex(entries=entries)
 
 
-def _parse_dispositivos(raw: str, known_lettered: set[str] | None = None) -> list[SubjectRef]:
+def _group_lettered(known_lettered: set[str] | None) -> dict[int, list[str]]:
+    """Agrupa artigos letrados pelo número base: {"212-A", "212-B"} → {212: ["212-A", "212-B"]}."""
+    grouped: dict[int, list[str]] = {}
+    for lettered in sorted(known_lettered or ()):
+        m = _LETTERED_RE.match(lettered)
+        if m:
+            grouped.setdefault(int(m.group(1)), []).append(lettered)
+    return grouped
+
+
+def _parse_dispositivos(
+    raw: str, lettered_by_base: dict[int, list[str]] | None = None,
+) -> list[SubjectRef]:
     """Converte string de dispositivos em lista de SubjectRef.
 
     Formatos aceitos:
@@ -104,40 +155,39 @@ def _parse_dispositivos(raw: str, known_lettered: set[str] | None = None) -> lis
 
         # Detect law prefix: "LO:23" or "LO:23,II"
         law_prefix = ""
-        law_m = re.match(r"^([A-Z]{2,})\s*:\s*(.+)$", line)
+        law_m = _LAW_PREFIX_RE.match(line)
         if law_m:
-            law_prefix = law_m.group(1)
+            law_prefix = sys.intern(law_m.group(1))
             line = law_m.group(2).strip()
 
         # Extract hint from parentheses at end of line: "13,I,b(propor privativamente)"
         hint = ""
-        hint_m = re.search(r"\(([^)]+)\)\s*$", line)
+        hint_m = _HINT_RE.search(line)
         if hint_m:
             hint = hint_m.group(1).strip()
             line = line[:hint_m.start()].strip()
 
         # Range: "211-275"
-        range_m = re.match(r"^(\d+)\s*[-–—]\s*(\d+)$", line)
+        range_m = _RANGE_RE.match(line)
         if range_m:
             start = int(range_m.group(1))
             end = int(range_m.group(2))
             for n in range(start, end + 1):
-                refs.append(SubjectRef(art=str(n), law_prefix=law_prefix, hint=hint))
+                refs.append(SubjectRef(art=sys.intern(str(n)), law_prefix=law_prefix, hint=hint))
                 # Inclui artigos letrados (ex: "212-A") cujo número base está no range
-                if known_lettered:
-                    for lettered in sorted(known_lettered):
-                        m = re.match(r"^(\d+)-[A-Za-z]", lettered)
-                        if m and int(m.group(1)) == n:
-                            refs.append(SubjectRef(art=lettered, law_prefix=law_prefix, hint=hint))
+                if lettered_by_base:
+                    for lettered in lettered_by_base.get(n, ()):
+                        refs.append(SubjectRef(art=lettered, law_prefix=law_prefix, hint=hint))
             continue
 
         # Single or with detail: "175,II" or "176,§10" or "176"
         parts = line.split(",", 1)
         art = parts[0].strip()
 
-        if not re.match(r"^(?:ADT)?\d+[-A-Za-z]*$", art):
+        if not _ART_RE.match(art):
             # Not a valid article reference, skip
             continue
+        art = sys.intern(art)
 
         if len(parts) == 1:
             refs.append(SubjectRef(art=art, law_prefix=law_prefix, hint=hint))
@@ -149,6 +199,7 @@ def _parse_dispositivos(raw: str, known_lettered: set[str] | None = None) -> lis
     return refs
 
 
+@lru_cache(maxsize=1024)
 def _normalize_detail(raw: str) -> str:
     """Normaliza detalhe do dispositivo para exibição.
 
@@ -164,24 +215,10 @@ def _normalize_detail(raw: str) -> str:
     if raw.upper() == "PU" or raw == "§ú":
         return "§ú"
 
-    # §N → § Nº
-    m = re.match(r"^[§Ss]\s*(\d+)$", raw)
-    if m:
-        num = m.group(1)
-        return f"§ {num}º"
-
-    # pN → § Nº
-    m = re.match(r"^p(\d+)$", raw, re.IGNORECASE)
+    # §N / pN → § Nº
+    m = _PARAGRAFO_RE.match(raw)
     if m:
-        num = m.group(1)
-        return f"§ {num}º"
-
-    # Roman numeral (inciso)
-    if re.match(r"^[IVXLC]+$", raw):
-        return raw
-
-    # Alínea
-    if re.match(r"^[a-z]\)$", raw):
-        return raw
+        return f"§ {m.group(1)}º"
 
+    # Inciso ("II"), alínea ("a)") e formatos não reconhecidos: sem alteração
     return raw
@@ -4,29 +4,41 @@ from __future__ import annotations
 
 import html
 import re
-from typing import Optional
+from typing import Iterator, Optional
 
 from .models import (
     ArticleBlock, DocumentUnit, Footnote, FootnotePara,
     ParsedDocument, SectionHeading, TextRun, UnitType,
 )
 
+_LEADING_NUM_RE = re.compile(r"(\d+)")
+_PARAGRAFO_COMPACT_RE = re.compile(r"§\s*(\d+)º")
+_OLD_IDENT_RE = re.compile(r"(.+?)\s+[-–—]\s")
+
 
 class HTMLRenderer:
     """Gera HTML dos cards com a mesma estrutura do index.html original."""
 
-    def __init__(self):
+    def __init__(self, include_private: bool = True):
         self.footnote_counter = 0
+        self.include_private = include_private  # False omite notas "b " (versão pública)
 
     def render(self, doc: ParsedDocument) -> str:
         """Renderiza todos os elementos do documento."""
-        parts: list[str] = []
+        return "".join(self.iter_render(doc))
+
+    def iter_render(self, doc: ParsedDocument) -> Iterator[str]:
+        """Gera o HTML card a card, separados por linha em branco."""
+        sep = ""
         for el in doc.elements:
             if isinstance(el, SectionHeading):
-                parts.append(self._render_heading(el))
+                card = self._render_heading(el)
             elif isinstance(el, ArticleBlock):
-                parts.append(self._render_article(el))
-        return "\n\n".join(parts)
+                card = self._render_article(el)
+            else:
+                continue
+            yield sep + card
+            sep = "\n\n"
 
     def _render_heading(self, h: SectionHeading) -> str:
         text = html.escape(h.text)
@@ -116,10 +128,10 @@ class HTMLRenderer:
             ctx[1] = unit.identifier  # "I", "II", etc.
             ctx[2] = ctx[3] = ""
         elif unit.unit_type == UnitType.ALINEA:
-            ctx[2] = re.sub(r"\)$", "", unit.identifier)  # "a)" → "a"
+            ctx[2] = unit.identifier.removesuffix(")")  # "a)" → "a"
             ctx[3] = ""
         elif unit.unit_type in (UnitType.SUB_ALINEA, UnitType.ITEM_NUM):
-            m = re.match(r"(\d+)", unit.identifier)
+            m = _LEADING_NUM_RE.match(unit.identifier)
             ctx[3] = m.group(1) if m else unit.identifier
         else:
             return ""
@@ -138,7 +150,7 @@ class HTMLRenderer:
             items.append((0, display_num))
         for i, seg in enumerate(parent_segments):
             # "§ 1º" → "§1", keep "§ú" as is
-            compact = re.sub(r"§\s*(\d+)º", r"§\1", seg)
+            compact = _PARAGRAFO_COMPACT_RE.sub(r"§\1", seg)
             items.append((i + 1, compact))
 
         parts: list[str] = []
@@ -173,8 +185,12 @@ class HTMLRenderer:
         inner += " — "
         inner += self._render_runs_after_identifier(unit)
 
+        footnotes = unit.footnotes
+        if not self.include_private:
+            footnotes = [fn for fn in footnotes if not fn.is_private]
+
         # Insert footnote superscript references inline
-        for fn in unit.footnotes:
+        for fn in footnotes:
             note_id = f"b{fn.number}" if fn.is_private else str(fn.number)
             inner += (
                 f'<sup class="footnote-ref" data-note="{note_id}">'
@@ -183,7 +199,7 @@ class HTMLRenderer:
 
         # Footnote content boxes (hidden by default, toggled by click)
         footnote_html = ""
-        for fn in unit.footnotes:
+        for fn in footnotes:
             footnote_html += "\n" + self._render_footnote(fn)
 
         return f"    <p{cls_style}>{inner}</p>{footnote_html}"
@@ -322,7 +338,7 @@ class HTMLRenderer:
             note = f' <span class="amendment-note">{html.escape(unit.amendment_note)}</span>'
         # Extract identifier (everything before first separator) for JS diff pairing
         ident = ""
-        m = re.match(r"(.+?)\s+[-–—]\s", unit.full_text)
+        m = _OLD_IDENT_RE.match(unit.full_text)
         if m:
             ident = html.escape(m.group(1).strip())
         ident_attr = f' data-ident="{ident}"' if ident else ""
@@ -330,6 +346,6 @@ class HTMLRenderer:
         return f'    <p class="{cls}"{ident_attr}>{text}{note}</p>'
 
 
-def render_cards(doc: ParsedDocument) -> str:
-    renderer = HTMLRenderer()
-    return renderer.render(doc)
+def render_cards(doc: ParsedDocument, *, include_private: bool = True) -> Iterator[str]:
+    renderer = HTMLRenderer(include_private=include_private)
+    return renderer.iter_render(doc)
@@ -9,6 +9,8 @@ from .models import (
     ParsedDocument, SectionHeading, TextRun, UnitType,
 )
 
+_BOLD_TAG_RE = re.compile(r"<b>(.*?)</b>")
+
 
 class MarkdownRenderer:
     """Gera arquivos Markdown otimizados para consumo por LLMs."""
@@ -249,6 +251,6 @@ class MarkdownRenderer:
     @staticmethod
     def _html_to_markdown(html_text: str) -> str:
         """Converte HTML simples (de referências) para Markdown."""
-        text = re.sub(r"<b>(.*?)</b>", r"**\1**", html_text)
+        text = _BOLD_TAG_RE.sub(r"**\1**", html_text)
         text = text.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
         return text
@@ -7,17 +7,40 @@ como is_old_version e permanecem in-place em children (interleaved).
 
 from __future__ import annotations
 
+from itertools import chain
+
 from .models import ArticleBlock, DocumentUnit, ParsedDocument, SectionHeading
 
 
-def resolve_amendments(doc: ParsedDocument) -> ParsedDocument:
-    """Processa emendas em todos os artigos do documento."""
+def resolve_amendments(
+    doc: ParsedDocument, law_mapping: dict[str, str] | None = None,
+) -> ParsedDocument:
+    """Processa emendas em todos os artigos do documento.
+
+    Se *law_mapping* ({nome da norma: prefixo}, da aba Normas do XLSX) for
+    informado, os artigos de outras normas recebem law_prefix e uids
+    prefixados na mesma passada.
+    """
     for el in doc.elements:
         if isinstance(el, ArticleBlock):
             _resolve_article(el)
+            if law_mapping and el.law_name in law_mapping:
+                _apply_law_prefix(el, law_mapping[el.law_name])
     return doc
 
 
+def _apply_law_prefix(art: ArticleBlock, law_prefix: str) -> None:
+    """Define law_prefix e prefixa os uids: "art5I" → "artLO5I".
+
+    Todo uid gerado por parse_docx começa com "art".
+    """
+    art.law_prefix = law_prefix
+    new_prefix = "art" + law_prefix
+    caput = (art.caput,) if art.caput else ()
+    for unit in chain(caput, art.children, art.all_versions):
+        unit.uid = new_prefix + unit.uid[3:]
+
+
 def _resolve_article(art: ArticleBlock) -> None:
     """Resolve versões múltiplas dentro de um ArticleBlock.
 
@@ -4,14 +4,29 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-_ROMAN_RE = re.compile(r"^[IVXLC]+$")
+from .parse_xlsx import as_workbook, main_sheet
+
+if TYPE_CHECKING:
+    from openpyxl.workbook.workbook import Workbook
+
+_ROMAN_CHARS = frozenset("IVXLC")
 _ALINEA_RE = re.compile(r"^[a-z]$")
 _ITEM_RE = re.compile(r"^\d+$")
 _ART_RE = re.compile(r"^(?:ADT)?\d+[-A-Za-z]*$")
 _RANGE_RE = re.compile(r"^\d+\s*[-\u2013\u2014]\s*\d+$")
 _LAW_PREFIX_LINE_RE = re.compile(r"^([A-Za-z]{2,})\s*:\s*(.+)$")
 _HINT_RE = re.compile(r"\(([^)]+)\)\s*$")
+_RANGE_SEP_RE = re.compile(r"[-\u2013\u2014]")
+_PARAGRAFO_RE = re.compile(r"^\u00a7\d+$")
+_PARAGRAFO_INCISO_RE = re.compile(r"^§(\d+|ú|u)$")
+_PREFIX_SPACE_RE = re.compile(r"^[A-Za-z]{2,}(?:\s+:|:\s+)")
+
+
+def _is_roman(s: str) -> bool:
+    """Inciso em algarismos romanos (I, V, X, L, C)."""
+    return bool(s) and set(s) <= _ROMAN_CHARS
 
 
 def _validate_detail(detail: str) -> str | None:
@@ -23,35 +38,35 @@ def _validate_detail(detail: str) -> str | None:
         return None
     if d.upper() == "PU" or d in ("\u00a7\u00fa", "\u00a7u"):
         return None
-    if re.match(r"^\u00a7\d+$", d):
+    if _PARAGRAFO_RE.match(d):
         return None
 
     parts = [p.strip() for p in d.split(",")]
 
     if len(parts) == 1:
         p = parts[0]
-        if _ROMAN_RE.match(p) or _ALINEA_RE.match(p) or _ITEM_RE.match(p):
+        if _is_roman(p) or _ALINEA_RE.match(p) or _ITEM_RE.match(p):
             return None
         return f"detalhe desconhecido: '{d}'"
 
     if len(parts) == 2:
         p0, p1 = parts
-        if _ROMAN_RE.match(p0) and _ROMAN_RE.match(p1):
+        if _is_roman(p0) and _is_roman(p1):
             return f"múltiplos incisos na mesma linha — use linhas separadas: '{p0}' e '{p1}'"
-        if _ROMAN_RE.match(p0) and _ALINEA_RE.match(p1):
+        if _is_roman(p0) and _ALINEA_RE.match(p1):
             return None  # inciso,alínea ✓
         if _ALINEA_RE.match(p0) and _ITEM_RE.match(p1):
             return None  # alínea,item ✓
         if _ALINEA_RE.match(p0) and _ALINEA_RE.match(p1):
             return f"múltiplas alíneas na mesma linha — use linhas separadas"
         # §ú,inciso ou §N,inciso (parágrafo com inciso) ✓
-        if re.match(r"^§(\d+|ú|u)$", p0) and _ROMAN_RE.match(p1):
+        if _PARAGRAFO_INCISO_RE.match(p0) and _is_roman(p1):
             return None
         return f"estrutura de detalhe inválida: '{d}'"
 
     if len(parts) == 3:
         p0, p1, p2 = parts
-        if _ROMAN_RE.match(p0) and _ALINEA_RE.match(p1) and _ITEM_RE.match(p2):
+        if _is_roman(p0) and _ALINEA_RE.match(p1) and _ITEM_RE.match(p2):
             return None  # inciso,alínea,item ✓
         return f"estrutura de detalhe inválida (esperado: inciso,alínea,item): '{d}'"
 
@@ -73,7 +88,7 @@ def _validate_device_line(raw_line: str, known_prefixes: set[str]) -> list[str]:
         line = line.replace(", ", ",")
 
     # 2. Espaço ao redor do ':' do prefixo de lei
-    if re.match(r"^[A-Za-z]{2,}\s+:", line) or re.match(r"^[A-Za-z]{2,}:\s+", line):
+    if _PREFIX_SPACE_RE.match(line):
         errors.append(
             f"espaço ao redor do ':' no prefixo — use 'SIGLA:artigo' sem espaços: '{raw_line.strip()}'"
         )
@@ -99,7 +114,7 @@ def _validate_device_line(raw_line: str, known_prefixes: set[str]) -> list[str]:
     # 5. Range de artigos (ex: "211-275")
     if _RANGE_RE.match(line):
         # Garante que é realmente dois números e não algo como "4-A"
-        nums = re.split(r"[-\u2013\u2014]", line)
+        nums = _RANGE_SEP_RE.split(line)
         if len(nums) == 2 and nums[0].strip().isdigit() and nums[1].strip().isdigit():
             start, end = int(nums[0].strip()), int(nums[1].strip())
             if start >= end:
@@ -130,16 +145,18 @@ def _validate_device_line(raw_line: str, known_prefixes: set[str]) -> list[str]:
     return errors
 
 
-def validate_xlsx(path: str | Path, law_mapping: dict[str, str]) -> list[str]:
+def validate_xlsx(source: str | Path | Workbook, law_mapping: dict[str, str]) -> list[str]:
     """Valida formato de remissivo.xlsx conforme instruções de preenchimento.
 
     Retorna lista de strings de erro/aviso para exibição no log do build.
+    ``source`` pode ser um caminho ou um workbook já aberto por open_workbook.
     ``law_mapping`` deve ser o dict {nome_lei: prefixo} retornado por parse_law_mapping.
     """
-    import openpyxl
+    with as_workbook(source) as wb:
+        return _validate_workbook(wb, law_mapping)
 
-    path = Path(path)
-    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+def _validate_workbook(wb: Workbook, law_mapping: dict[str, str]) -> list[str]:
     messages: list[str] = []
 
     has_normas = "Normas" in wb.sheetnames
@@ -152,21 +169,12 @@ def validate_xlsx(path: str | Path, law_mapping: dict[str, str]) -> list[str]:
     known_prefixes: set[str] = set(law_mapping.values())
 
     # Localiza aba principal
-    ws = None
-    for name in wb.sheetnames:
-        if name != "Normas":
-            ws = wb[name]
-            break
-
+    ws = main_sheet(wb)
     if ws is None:
-        wb.close()
         messages.append("  erro: nenhuma aba principal (não-Normas) encontrada na planilha")
         return messages
 
-    rows = list(ws.iter_rows(min_row=2, values_only=True))
-    wb.close()
-
-    for i, row in enumerate(rows, start=2):  # linha 1 = cabeçalho
+    for i, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):  # linha 1 = cabeçalho
         if not row or len(row) < 1:
             continue
 
@@ -0,0 +1,101 @@
+"""Testes unitários para a montagem do HTML final (assemble)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.assemble import _load_assets, assemble
+
+pytestmark = pytest.mark.unit
+
+TEMPLATE = "<style>{{CSS}}</style>\n<main>{{CARDS}}</main>\n<script>{{JS}}</script>\n"
+JS = (
+    "const S = /*__SYSTEMATIC_INDEX__*/[];\n"
+    "const A = /*__SUBJECT_INDEX__*/[];\n"
+    "const R = /*__REFERENCIAS_INDEX__*/[];\n"
+    "const M = /*__SUMMARIES_MAP__*/{};\n"
+    'const I = /*__INFO_HTML__*/"";\n'
+)
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    """Diretório com templates/ e static/ mínimos."""
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "static").mkdir()
+    (tmp_path / "templates" / "base.html").write_text(TEMPLATE, encoding="utf-8")
+    (tmp_path / "static" / "style.css").write_text("p{}", encoding="utf-8")
+    (tmp_path / "static" / "app.js").write_text(JS, encoding="utf-8")
+    _load_assets.cache_clear()
+    yield tmp_path
+    _load_assets.cache_clear()
+
+
+def _assemble(base_dir, output_path):
+    return assemble(
+        cards_html=iter(["<div>1</div>", "\n\n", "<div>2</div>"]),
+        systematic_index=[{"title": "TÍTULO I"}],
+        subject_index=[{"subject": "Mesa"}],
+        referencias_index=[],
+        summaries_map={"1": "Síntese"},
+        info_html="<p>info</p>",
+        base_dir=base_dir,
+        output_path=output_path,
+    )
+
+
+class TestAssemble:
+    def test_template_minimo(self, base_dir):
+        out = base_dir / "dist" / "index.html"
+        size = _assemble(base_dir, out)
+        html = out.read_text(encoding="utf-8")
+        assert size == len(html.encode("utf-8"))
+        assert html == (
+            "<style>p{}</style>\n"
+            "<main><div>1</div>\n\n<div>2</div></main>\n"
+            "<script>"
+            'const S = [{"title":"TÍTULO I"}];\n'
+            'const A = [{"subject":"Mesa"}];\n'
+            "const R = [];\n"
+            'const M = {"1":"Síntese"};\n'
+            f"const I = {json.dumps('<p>info</p>')};\n"
+            "</script>\n"
+        )
+
+    def test_placeholder_ausente_no_template(self, base_dir):
+        (base_dir / "templates" / "base.html").write_text(
+            "<main>{{CARDS}}</main><script>{{JS}}</script>", encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match=r"CSS \(0x\)"):
+            _assemble(base_dir, base_dir / "index.html")
+
+    def test_placeholder_duplicado_no_js(self, base_dir):
+        (base_dir / "static" / "app.js").write_text(
+            JS + "const S2 = /*__SYSTEMATIC_INDEX__*/[];\n", encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match=r"SYSTEMATIC_INDEX \(2x\)"):
+            _assemble(base_dir, base_dir / "index.html")
+
+    def test_falha_nos_cards_preserva_saida_anterior(self, base_dir):
+        out = base_dir / "index.html"
+        out.write_text("página anterior", encoding="utf-8")
+
+        def cards():
+            yield "<div>1</div>"
+            raise RuntimeError("falha no render")
+
+        with pytest.raises(RuntimeError, match="falha no render"):
+            assemble(
+                cards_html=cards(),
+                systematic_index=[],
+                subject_index=[],
+                referencias_index=[],
+                summaries_map={},
+                info_html="",
+                base_dir=base_dir,
+                output_path=out,
+            )
+        assert out.read_text(encoding="utf-8") == "página anterior"
+        assert sorted(p.name for p in base_dir.iterdir()) == ["index.html", "static", "templates"]
@@ -0,0 +1,251 @@
+"""Testes unitários do pipeline em build.py (sem DOCX real)."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+import build
+from build import (
+    ParsedSources, ValidationReport, _degraded_marker, _inputs_stamp,
+    _is_up_to_date, _write_inputs_stamp,
+)
+from src.models import ParsedDocument
+
+pytestmark = pytest.mark.unit
+
+
+def _touch(path, mtime_ns: int) -> None:
+    path.write_text("x", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# ── _is_up_to_date ──────────────────────────────────────────────────────
+
+class TestIsUpToDate:
+    def test_saida_mais_nova(self, tmp_path):
+        src = tmp_path / "fonte.docx"
+        out = tmp_path / "index.html"
+        _touch(src, 1_000_000_000)
+        _touch(out, 2_000_000_000)
+        _write_inputs_stamp(out, [src])
+        assert _is_up_to_date(out, [src]) is True
+
+    def test_fonte_mais_nova(self, tmp_path):
+        src = tmp_path / "fonte.docx"
+        out = tmp_path / "index.html"
+        _touch(out, 1_000_000_000)
+        _touch(src, 2_000_000_000)
+        _write_inputs_stamp(out, [src])
+        assert _is_up_to_date(out, [src]) is False
+
+    def test_saida_inexistente(self, tmp_path):
+        src = tmp_path / "fonte.docx"
+        _touch(src, 1_000_000_000)
+        assert _is_up_to_date(tmp_path / "index.html", [src]) is False
+
+    def test_fonte_inexistente_ignorada(self, tmp_path):
+        out = tmp_path / "index.html"
+        _touch(out, 1_000_000_000)
+        _write_inputs_stamp(out, [tmp_path / "ausente.docx"])
+        assert _is_up_to_date(out, [tmp_path / "ausente.docx"]) is True
+
+    def test_build_degradado_nao_esta_atualizado(self, tmp_path):
+        src = tmp_path / "fonte.docx"
+        out = tmp_path / "index.html"
+        _touch(src, 1_000_000_000)
+        _touch(out, 2_000_000_000)
+        _write_inputs_stamp(out, [src])
+        _degraded_marker(out).touch()
+        assert _is_up_to_date(out, [src]) is False
+
+    def test_sem_registro_de_entradas(self, tmp_path):
+        src = tmp_path / "fonte.docx"
+        out = tmp_path / "index.html"
+        _touch(src, 1_000_000_000)
+        _touch(out, 2_000_000_000)
+        assert _is_up_to_date(out, [src]) is False
+
+    def test_outra_fonte_mais_antiga(self, tmp_path):
+        # --docx apontando para outro arquivo, mesmo mais antigo que a saída
+        src = tmp_path / "fonte.docx"
+        other = tmp_path / "outra.docx"
+        out = tmp_path / "index.html"
+        _touch(src, 1_000_000_000)
+        _touch(other, 1_000_000_000)
+        _touch(out, 2_000_000_000)
+        _write_inputs_stamp(out, [src])
+        assert _is_up_to_date(out, [other]) is False
+
+
+# ── main(): versão privada atualizada ───────────────────────────────────
+
+def _sources(*, errors: int = 0, degraded: bool = False) -> ParsedSources:
+    report = ValidationReport()
+    for _ in range(errors):
+        report.add("ref_cruzada", "erro", "Art. 999")
+    return ParsedSources(
+        doc=ParsedDocument(),
+        law_mapping={},
+        subject_list=[],
+        referencias_data=[],
+        info_html="",
+        systematic_index=[],
+        summaries_map={},
+        report=report,
+        degraded=degraded,
+    )
+
+
+@pytest.fixture
+def private_build(tmp_path, monkeypatch):
+    """main() só com a versão privada, apontando para um diretório temporário."""
+    private = tmp_path / "priv" / "index.html"
+    monkeypatch.setattr(build, "_load_config", lambda: {"output": {"private": str(private)}})
+    monkeypatch.setattr(build, "_build_inputs", lambda args: [])
+    rendered: list = []
+    monkeypatch.setattr(build, "_build_once", lambda **kw: rendered.append(kw))
+
+    def run(*flags: str, sources: ParsedSources) -> int:
+        monkeypatch.setattr(build, "_parse_sources", lambda args, html=True: sources)
+        monkeypatch.setattr(sys, "argv", ["build.py", "--only-private", "--skip-markdown", *flags])
+        return build.main()
+
+    return private, rendered, run
+
+
+class TestMainPrivadaAtualizada:
+    def test_strict_valida_mesmo_sem_renderizar(self, private_build):
+        private, rendered, run = private_build
+        private.parent.mkdir()
+        private.write_text("ok", encoding="utf-8")
+        _write_inputs_stamp(private, [])
+        assert run("--strict", sources=_sources(errors=1)) == 1
+        assert rendered == []
+
+    def test_sem_erros_nao_renderiza(self, private_build):
+        private, rendered, run = private_build
+        private.parent.mkdir()
+        private.write_text("ok", encoding="utf-8")
+        _write_inputs_stamp(private, [])
+        assert run(sources=_sources()) == 0
+        assert rendered == []
+
+    def test_build_degradado_e_refeito(self, private_build):
+        private, rendered, run = private_build
+        private.parent.mkdir()
+        private.write_text("ok", encoding="utf-8")
+        _write_inputs_stamp(private, [])
+        _degraded_marker(private).touch()
+        assert run(sources=_sources()) == 0
+        assert len(rendered) == 1
+        assert not _degraded_marker(private).exists()
+
+    def test_build_degradado_grava_marcador(self, private_build):
+        private, rendered, run = private_build
+        private.parent.mkdir()
+        run(sources=_sources(degraded=True))
+        assert len(rendered) == 1
+        assert _degraded_marker(private).exists()
+
+    def test_falha_no_render_marca_degradado(self, private_build, monkeypatch):
+        private, rendered, run = private_build
+        private.parent.mkdir()
+        private.write_text("ok", encoding="utf-8")
+
+        def falha(**kw):
+            raise RuntimeError("falha no render")
+
+        monkeypatch.setattr(build, "_build_once", falha)
+        with pytest.raises(RuntimeError):
+            run("--force", sources=_sources())
+        assert _degraded_marker(private).exists()
+
+        # Execução seguinte não toma a saída como atualizada
+        monkeypatch.setattr(build, "_build_once", lambda **kw: rendered.append(kw))
+        assert run(sources=_sources()) == 0
+        assert len(rendered) == 1
+        assert not _degraded_marker(private).exists()
+        assert _inputs_stamp(private).exists()
+
+
+# ── Cache de parse (_cached) ────────────────────────────────────────────
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    """CACHE_DIR e src/ temporários; retorna (fonte, módulo, chamadas, parser)."""
+    base = tmp_path / "base"
+    (base / "src").mkdir(parents=True)
+    module = base / "src" / "parser.py"
+    _touch(module, 1_000_000_000)
+    source = tmp_path / "fonte.docx"
+    _touch(source, 1_000_000_000)
+    monkeypatch.setattr(build, "BASE_DIR", base)
+    monkeypatch.setattr(build, "CACHE_DIR", tmp_path / "cache")
+
+    calls: list[str] = []
+
+    def parser(path):
+        calls.append(path.read_text(encoding="utf-8"))
+        return {"conteudo": calls[-1], "n": len(calls)}
+
+    return source, module, calls, parser
+
+
+def _cache_files():
+    return sorted(build.CACHE_DIR.glob("docx-*.pkl"))
+
+
+class TestCached:
+    def test_miss_depois_hit(self, cache_env):
+        source, _, calls, parser = cache_env
+        first = build._cached("docx", source, parser, source)
+        second = build._cached("docx", source, parser, source)
+        assert second == first
+        assert len(calls) == 1
+        assert len(_cache_files()) == 1
+
+    def test_fonte_alterada_invalida(self, cache_env):
+        source, _, calls, parser = cache_env
+        build._cached("docx", source, parser, source)
+        _touch(source, 2_000_000_000)
+        result = build._cached("docx", source, parser, source)
+        assert result["n"] == 2
+        assert len(calls) == 2
+
+    def test_codigo_do_parser_alterado_invalida(self, cache_env):
+        source, module, calls, parser = cache_env
+        build._cached("docx", source, parser, source)
+        _touch(module, 2_000_000_000)
+        build._cached("docx", source, parser, source)
+        assert len(calls) == 2
+
+    def test_entrada_antiga_removida(self, cache_env):
+        source, _, _, parser = cache_env
+        build._cached("docx", source, parser, source)
+        old = _cache_files()
+        _touch(source, 2_000_000_000)
+        build._cached("docx", source, parser, source)
+        new = _cache_files()
+        assert len(new) == 1
+        assert new != old
+
+    def test_no_cache(self, cache_env):
+        source, _, calls, parser = cache_env
+        build._cached("docx", source, parser, source, use_cache=False)
+        build._cached("docx", source, parser, source, use_cache=False)
+        assert len(calls) == 2
+        assert not build.CACHE_DIR.exists()
+
+    def test_pickle_corrompido_reparseia(self, cache_env):
+        source, _, calls, parser = cache_env
+        build._cached("docx", source, parser, source)
+        (path,) = _cache_files()
+        path.write_bytes(b"nao e pickle")
+        result = build._cached("docx", source, parser, source)
+        assert result["n"] == 2
+        # Entrada regravada e válida de novo
+        assert build._cached("docx", source, parser, source) == result
+        assert len(calls) == 2
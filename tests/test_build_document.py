@@ -227,3 +227,26 @@ class TestBuildDocumentSpecial:
         assert isinstance(doc.elements[0], ArticleBlock)
         assert isinstance(doc.elements[1], SectionHeading)
         assert isinstance(doc.elements[2], ArticleBlock)
+
+
+class TestParsedDocumentByType:
+    def test_articles_e_headings_na_ordem(self):
+        classified = [
+            _cp(UnitType.TITULO, "TÍTULO I", is_centered=True),
+            _cp(UnitType.ARTIGO, "Art. 1º - A", identifier="Art. 1º", art_number="1"),
+            _cp(UnitType.CAPITULO, "CAPÍTULO I", is_centered=True),
+            _cp(UnitType.ARTIGO, "Art. 2º - B", identifier="Art. 2º", art_number="2"),
+        ]
+        doc = _build_document(classified)
+        assert [a.art_number for a in doc.articles] == ["1", "2"]
+        assert [h.data_section for h in doc.headings] == ["tit1", "cap1"]
+
+    def test_reindex_apos_alterar_elements(self):
+        doc = _build_document([
+            _cp(UnitType.ARTIGO, "Art. 1º - A", identifier="Art. 1º", art_number="1"),
+        ])
+        assert len(doc.articles) == 1
+        doc.elements.append(ArticleBlock(art_number="2"))
+        assert len(doc.articles) == 1  # índice ainda não reconstruído
+        doc.reindex()
+        assert [a.art_number for a in doc.articles] == ["1", "2"]
@@ -0,0 +1,51 @@
+"""Testes unitários para o filtro de notas privadas em render_cards."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.models import (
+    ArticleBlock, DocumentUnit, Footnote, FootnotePara,
+    ParsedDocument, TextRun, UnitType,
+)
+from src.render_html import render_cards
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def doc_com_notas() -> ParsedDocument:
+    """Artigo com uma nota pública (1) e uma privada ("b 1") no caput."""
+    caput = DocumentUnit(
+        unit_type=UnitType.ARTIGO,
+        identifier="Art. 1º",
+        uid="art1",
+        runs=[TextRun(text="Art. 1º - Texto do caput.")],
+        footnotes=[
+            Footnote(number=1, paragraphs=[FootnotePara(runs=[TextRun(text="Nota pública")])]),
+            Footnote(
+                number=1,
+                paragraphs=[FootnotePara(runs=[TextRun(text="Anotação reservada")])],
+                is_private=True,
+            ),
+        ],
+    )
+    return ParsedDocument(elements=[ArticleBlock(art_number="1", caput=caput)])
+
+
+class TestNotasPrivadas:
+    def test_versao_publica_omite_nota_privada(self, doc_com_notas):
+        out = "".join(render_cards(doc_com_notas, include_private=False))
+        assert "Anotação reservada" not in out
+        assert 'data-note="b1"' not in out
+        assert "[b1]" not in out
+        # Nota pública continua presente
+        assert "Nota pública" in out
+        assert 'data-note="1"' in out
+
+    def test_versao_privada_inclui_nota_privada(self, doc_com_notas):
+        out = "".join(render_cards(doc_com_notas, include_private=True))
+        assert "Anotação reservada" in out
+        assert '<sup class="footnote-ref" data-note="b1">[b1]</sup>' in out
+        assert '<div class="footnote-box" data-note="b1">' in out
+        assert "Nota pública" in out
@@ -162,3 +162,19 @@ class TestResolveAmendmentsDocument:
         assert result is doc  # modifica in-place
         assert art1.children[0].is_old_version is True
         assert art1.children[1].is_old_version is False
+
+    def test_law_mapping_prefixa_uids(self):
+        art_lo = _make_article("5", [_make_unit("II", "art5II")])
+        art_lo.law_name = "Lei Orgânica"
+        art_lo.all_versions = [_make_unit("Art. 5º", "art5_2", unit_type=UnitType.ARTIGO)]
+        art_ri = _make_article("5", [_make_unit("II", "art5II_2")])
+        art_ri.law_name = "Regimento Interno"
+        doc = ParsedDocument(elements=[art_lo, art_ri])
+        resolve_amendments(doc, {"Lei Orgânica": "LO"})
+        assert art_lo.law_prefix == "LO"
+        assert art_lo.caput.uid == "artLO5"
+        assert art_lo.children[0].uid == "artLO5II"
+        assert art_lo.all_versions[0].uid == "artLO5_2"
+        # Norma sem prefixo na aba Normas → inalterada
+        assert art_ri.law_prefix == ""
+        assert art_ri.caput.uid == "art5"
@@ -0,0 +1,59 @@
+"""Testes unitários para SubjectIndex.to_list (agrupamento e ordenação)."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.models import SubjectEntry, SubjectIndex, SubjectRef
+
+pytestmark = pytest.mark.unit
+
+
+class TestToList:
+    def test_agrupa_assunto_com_subassuntos_e_vides(self):
+        index = SubjectIndex(entries=[
+            SubjectEntry("Mesa", refs=[SubjectRef("10")], vides=["Presidente"]),
+            SubjectEntry("Comissões", refs=[SubjectRef("40", detail="II")]),
+            SubjectEntry("Mesa", "Composição", refs=[SubjectRef("LO:5", law_prefix="LO", hint="eleição")]),
+            SubjectEntry("Mesa", refs=[SubjectRef("11")]),
+        ])
+        assert index.to_list() == [
+            {"subject": "Comissões", "refs": [{"art": "40", "detail": "II"}]},
+            {
+                "subject": "Mesa",
+                "refs": [{"art": "10", "detail": ""}, {"art": "11", "detail": ""}],
+                "children": [{
+                    "sub_subject": "Composição",
+                    "refs": [{"art": "LO:5", "detail": "", "law_prefix": "LO", "hint": "eleição"}],
+                }],
+                "vides": ["Presidente"],
+            },
+        ]
+
+    def test_omite_listas_vazias(self):
+        index = SubjectIndex(entries=[SubjectEntry("Mesa", "Composição")])
+        assert index.to_list() == [
+            {"subject": "Mesa", "children": [{"sub_subject": "Composição", "refs": []}]},
+        ]
+
+    def test_ordem_sem_distincao_de_caixa(self):
+        index = SubjectIndex(entries=[
+            SubjectEntry("votação"),
+            SubjectEntry("Ata"),
+            SubjectEntry("Vereador"),
+            SubjectEntry("ética"),
+        ])
+        assert [i["subject"] for i in index.to_list()] == ["Ata", "Vereador", "votação", "ética"]
+
+    def test_assuntos_que_diferem_so_na_caixa(self):
+        # Grupos separados e adjacentes, na ordem da primeira aparição
+        index = SubjectIndex(entries=[
+            SubjectEntry("mesa", refs=[SubjectRef("2")]),
+            SubjectEntry("Mesa", refs=[SubjectRef("1")]),
+            SubjectEntry("mesa", refs=[SubjectRef("3")]),
+            SubjectEntry("Ata"),
+        ])
+        result = index.to_list()
+        assert [i["subject"] for i in result] == ["Ata", "mesa", "Mesa"]
+        assert [r["art"] for r in result[1]["refs"]] == ["2", "3"]
+        assert [r["art"] for r in result[2]["refs"]] == ["1"]